@@ -1,10 +1,11 @@
 import logging
 import re
-from collections.abc import Iterable, Sequence
+from asyncio import create_task, sleep
+from collections.abc import Callable, Iterable, Sequence
 from datetime import datetime, timedelta
 from functools import cache, lru_cache
 from itertools import batched
-from math import isnan
+from math import isnan, nan
 from os import PathLike, environ
 from pathlib import Path
 from typing import Any, NamedTuple, TypedDict, TypeGuard
@@ -24,7 +25,6 @@ from eometadatatool.flags import get_odata_endpoint
 from eometadatatool.geom_utils import normalize_geometry
 from eometadatatool.odata_response import get_odata_response
 from eometadatatool.s3_utils import S3Path
-from eometadatatool.stac.framework.stac_bands import S2_Bands
 
 _HTTP = AsyncClient(
     headers={'User-Agent': 'eometadatatool'},
@@ -145,6 +145,31 @@ async def get_odata_id(input: str | dict[str, Any], /) -> ODataInfo:
     )
 
 
+async def overlap_odata[**P, T](
+    item_path: str,
+    build: Callable[P, T],
+    /,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> tuple[ODataInfo, T]:
+    """
+    Call build() while the OData lookup for item_path is in flight.
+    The lookup is cancelled if build() raises.
+
+    :param item_path: Product S3Path from OData.
+    :param build: Synchronous item builder, called with args and kwargs.
+    :return: OData product information and the build() result.
+    """
+    odata_task = create_task(get_odata_id(item_path))
+    await sleep(0)  # let the request start before blocking on build()
+    try:
+        result = build(*args, **kwargs)
+    except BaseException:
+        odata_task.cancel()
+        raise
+    return await odata_task, result
+
+
 def _odata_filter_parameters_from_s3path(s3path: Path) -> str:
     parts = s3path.parts
     collection = parts[2].upper()
@@ -303,22 +328,18 @@ def hex_to_multihash(hex_str: str, fn_code: int) -> str | None:
     return (byte_fn_code + byte_hash_length).hex() + hex_str.lower()
 
 
-def s2_compute_average(
-    metadata: dict[str, MappedMetadataValue | float], field: str
-) -> float:
-    """Compute the average value of a given field for all Sentinel-2 bands.
+def s2_compute_average(values: Iterable[MappedMetadataValue | float]) -> float:
+    """Compute the average of per-band Sentinel-2 values, ignoring NaN.
 
-    :param metadata: Mapping of metadata values.
-    :param field: Field to compute the average for.
-    :return: Average value.
+    :param values: Band values, e.g. one field read for every band in S2_Bands.
+    :return: Average value, or NaN if no value is defined.
     """
     bands_values: list[float] = []
-    for band in S2_Bands:
-        value = metadata[f'asset:{band}:{field}']
+    for value in values:
         value_float = value['Value'] if isinstance(value, dict) else value
         if not isnan(value_float):
             bands_values.append(value_float)
-    return np.mean(bands_values).tolist()
+    return np.mean(bands_values).tolist() if bands_values else nan
 
 
 def format_baseline(x: str | float) -> str:
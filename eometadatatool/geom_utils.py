@@ -1,7 +1,7 @@
 import logging
 from functools import partial
 from itertools import product
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, Any, overload
 
 import numpy as np
 from numpy.typing import NDArray
@@ -12,6 +12,8 @@ from shapely import (
     Polygon,
     box,
     count_coordinates,
+    get_coordinates,
+    get_num_interior_rings,
     make_valid,
     multipolygons,
     prepare,
@@ -232,3 +234,21 @@ def simplify_geometry[T: BaseGeometry](
 
     logging.debug('simplify_adaptive: optimal_tol=%g after %d steps', optimal_tol, i)
     return _cart2geod(simplify(footprint, optimal_tol))
+
+
+def simplified_geojson(geometry: Polygon | MultiPolygon) -> dict[str, Any]:
+    """Simplify a geometry and return it as a GeoJSON geometry object."""
+    # small single-ring polygons are never simplified, emit them directly
+    # instead of going through __geo_interface__ nested tuple building
+    if (
+        isinstance(geometry, Polygon)
+        and count_coordinates(geometry) <= 10
+        and not get_num_interior_rings(geometry)
+    ):
+        return {
+            'type': 'Polygon',
+            'coordinates': [
+                get_coordinates(geometry, include_z=geometry.has_z).tolist()
+            ],
+        }
+    return simplify_geometry(geometry).__geo_interface__
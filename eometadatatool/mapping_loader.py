@@ -1,4 +1,5 @@
 import csv
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, NamedTuple, TypedDict, cast
 
@@ -52,7 +53,9 @@ def load_mappings(
         else:
             file = row['file']
 
-        result.setdefault(file, {})[row['metadata']] = MappingTarget(
+        # Interned names share identity with the (interned) identifier literals
+        # templates use to read attributes, turning lookups into pointer compares
+        result.setdefault(file, {})[sys.intern(row['metadata'])] = MappingTarget(
             xpath,
             data_type,
         )
@@ -0,0 +1,59 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
+
+
+def build_common_s3_props(
+    attr: Mapping[str, Any],
+    *,
+    instruments: Sequence[str],
+    gsd: int,
+    timeliness: str,
+    statistics: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the item properties shared by the Sentinel-3 OLCI and SLSTR templates."""
+    props: dict[str, Any] = {
+        'datetime': attr['beginningDateTime'],
+        'start_datetime': attr['beginningDateTime'],
+        'end_datetime': attr['endingDateTime'],
+        'platform': (
+            attr['platformShortName'] + attr['platformSerialIdentifier']
+        ).lower(),
+        'constellation': attr['platformShortName'].lower(),
+        'instruments': instruments,
+        'gsd': gsd,
+        'processing:level': 'L' + attr['processingLevel'],
+        'processing:datetime': attr['processingDate'],
+        'proj:code': None,
+        'sat:absolute_orbit': attr['orbitNumber'],
+        'sat:relative_orbit': attr['relativeOrbitNumber'],
+        'sat:orbit_cycle': attr['cycleNumber'],
+        'sat:orbit_state': attr['orbitDirection'].lower(),
+        'sat:platform_international_designator': attr['nssdcIdentifier'],
+        'eo:cloud_cover': round(attr['cloudCover'], 2),
+        'product:type': attr['productType'],
+        'product:timeliness': timeliness,
+        'product:timeliness_category': attr['timeliness'],
+        'statistics': statistics,
+    }
+    sanitize_relative_orbit(props)
+    if processor_version := attr.get('processorVersion'):
+        props['processing:version'] = processor_version
+    return props
+
+
+def olci_l2_statistics(attr: Mapping[str, Any]) -> dict[str, Any]:
+    """Build the statistics shared by the OLCI L2 land and water templates."""
+    return {
+        'saline_water': attr['salineWaterCover'],
+        'coastal': attr['coastalCover'],
+        'fresh_inland_water': attr['freshInlandWaterCover'],
+        'tidal_region': attr['tidalRegionCover'],
+        'land': attr['landCover'],
+        'invalid': attr['invalidPixels'],
+        'cosmetic': attr['cosmeticPixels'],
+        'duplicated': attr['duplicatedPixels'],
+        'saturated': attr['saturatedPixels'],
+        'dubious_samples': attr['dubiousSamples'],
+    }
@@ -3,7 +3,7 @@ import mimetypes
 from collections import ChainMap
 from collections.abc import Collection, Mapping, MutableSet
 from dataclasses import dataclass, field
-from typing import Any, Literal, override
+from typing import Any, ClassVar, Literal, NamedTuple, override
 
 import orjson
 
@@ -59,6 +59,13 @@ class STACAsset:
     extra: Mapping[str, Any] = EMPTY_MAPPING
     """Additional properties."""
 
+    _sync_generate: ClassVar[bool] = True
+    """Whether generate_sync() produces the full asset, without awaiting generate()."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._sync_generate = cls.generate is STACAsset.generate
+
     def __post_init__(self):
         if self.path[-1] == '/':
             self.path = self.path.rstrip('/')
@@ -69,6 +76,18 @@ class STACAsset:
         extensions: MutableSet[StacExtension],
         item_props: dict[str, Any] = {},
     ) -> dict[str, Any]:
+        return self.generate_sync(odata, extensions, item_props)
+
+    def generate_sync(
+        self,
+        odata: ODataInfo | None,
+        extensions: MutableSet[StacExtension],
+        item_props: Mapping[str, Any] = EMPTY_MAPPING,
+    ) -> dict[str, Any]:
+        """Generate the asset properties without I/O.
+
+        Subclasses that need I/O override the async generate() instead.
+        """
         props: dict[str, Any] = {
             'type': self.media_type,
             'title': self.title,
@@ -202,11 +221,11 @@ class ProductAsset(STACAsset):
     include_other_alternates: bool = field(default=False, init=False)
 
     @override
-    async def generate(
+    def generate_sync(
         self,
         odata: ODataInfo | None,
         extensions: MutableSet[StacExtension],
-        item_props: dict[str, Any] = {},
+        item_props: Mapping[str, Any] = EMPTY_MAPPING,
     ) -> dict[str, Any]:
         if odata:
             self.https_href = f'https://download.dataspace.copernicus.eu/odata/v1/Products({odata.id})/$value'
@@ -214,7 +233,7 @@ class ProductAsset(STACAsset):
                 self.checksum = odata.checksum
             if odata.file_size > 0:
                 self.size = odata.file_size
-        return await super().generate(odata, extensions, item_props)
+        return super().generate_sync(odata, extensions, item_props)
 
 
 @dataclass(kw_only=True)
@@ -230,6 +249,42 @@ class NetCDFAsset(STACAsset):
     roles: Collection[str] = field(default=('data',))
 
 
+class NetCDFAssetKeys(NamedTuple):
+    name: str
+    """Asset name in the item."""
+
+    title: str
+    """Asset title."""
+
+    path: str
+    """Attribute holding the path of the file, relative to the product."""
+
+    checksum: str
+    """Attribute holding the checksum of the file."""
+
+    size: str
+    """Attribute holding the size of the file."""
+
+
+def netcdf_asset_keys(
+    name: str, title: str, attr_key: str | None = None
+) -> NetCDFAssetKeys:
+    """Precompute the attribute names of a NetCDF asset.
+
+    :param name: Asset name in the item.
+    :param title: Asset title.
+    :param attr_key: Attribute key after 'asset:', defaults to the asset name.
+    """
+    path = f'asset:{name if attr_key is None else attr_key}'
+    return NetCDFAssetKeys(
+        name=name,
+        title=title,
+        path=path,
+        checksum=f'{path}:checksum',
+        size=f'{path}:size',
+    )
+
+
 @dataclass(kw_only=True)
 class CloudOptimizedGeoTIFFAsset(STACAsset):
     media_type: str = field(
@@ -244,7 +299,7 @@ class CloudOptimizedGeoTIFFAsset(STACAsset):
         extensions: MutableSet[StacExtension],
         item_props: dict[str, Any] = {},
     ) -> dict[str, Any]:
-        props = await super().generate(odata, extensions, item_props)
+        props = super().generate_sync(odata, extensions, item_props)
         await _fill_from_file(self.path, props, item_props)
         return props
 
@@ -271,15 +326,15 @@ class ThumbnailAsset(STACAsset):
         self.media_type = media_type
 
     @override
-    async def generate(
+    def generate_sync(
         self,
         odata: ODataInfo | None,
         extensions: MutableSet[StacExtension],
-        item_props: dict[str, Any] = {},
+        item_props: Mapping[str, Any] = EMPTY_MAPPING,
     ) -> dict[str, Any]:
         if odata:
             self.https_href = odata.thumbnail_link
-        return await super().generate(odata, extensions, item_props)
+        return super().generate_sync(odata, extensions, item_props)
 
 
 async def _fill_from_file(
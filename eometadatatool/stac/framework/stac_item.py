@@ -1,9 +1,7 @@
-import datetime
-
 import re
 from collections.abc import Collection, Mapping, MutableSet
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 from shapely import MultiPolygon, Polygon, from_wkt
 
@@ -11,7 +9,7 @@ from eometadatatool._version import __version__
 from eometadatatool.dlc import (
     ODataInfo,
 )
-from eometadatatool.geom_utils import normalize_geometry, simplify_geometry
+from eometadatatool.geom_utils import normalize_geometry, simplified_geojson
 from eometadatatool.stac.framework.stac_asset import (
     ProductAsset,
     STACAsset,
@@ -19,6 +17,15 @@ from eometadatatool.stac.framework.stac_asset import (
 from eometadatatool.stac.framework.stac_extension import StacExtension
 from eometadatatool.stac.framework.stac_link import STACLink
 
+_EXPIRES: Final[str] = '9999-01-01T00:00:00.000000Z'
+
+_BASE_EXTENSIONS: Final[frozenset[StacExtension]] = frozenset((
+    StacExtension.AUTHENTICATION,
+    StacExtension.STORAGE,
+    StacExtension.TIMESTAMP,
+    StacExtension.PROCESSING,
+))
+
 
 @dataclass(kw_only=True, slots=True)
 class STACItem:
@@ -50,20 +57,20 @@ class STACItem:
     """Additional STAC extensions implemented by this item."""
 
     extra: Mapping[str, Any]
-    """Additional properties."""
+    """Additional properties. Must be valid as-is, see sanitize_relative_orbit()."""
 
     async def generate(self) -> dict[str, Any]:
         geom: Polygon | MultiPolygon = normalize_geometry(from_wkt(self.coordinates))  # type: ignore
 
-        extensions = {
-            StacExtension.AUTHENTICATION,
-            StacExtension.STORAGE,
-            StacExtension.TIMESTAMP,
-            StacExtension.PROCESSING,
-            *self.extensions,
-        }
+        extensions = set(_BASE_EXTENSIONS)
+        extensions.update(self.extensions)
 
         props: dict[str, Any] = {}
+        auth_schemes: dict[str, Any] = {
+            's3': {
+                'type': 's3',
+            },
+        }
 
         if self.odata:
             props.update(
@@ -72,79 +79,60 @@ class STACItem:
                     ('created', self.odata.created_isodate),
                     ('updated', self.odata.updated_isodate),
                     ('published', self.odata.published_isodate),
-                    ('eopf:origin_datetime', self.odata.created_isodate),
                 )
                 if not v.startswith('1970-01-01T00:00:00')
             )
-
-        props.update({
-            'auth:schemes': {
-                's3': {
-                    'type': 's3',
-                },
-            },
-            'storage:schemes': {
-                'cdse-s3': {
-                    'title': 'Copernicus Data Space Ecosystem S3',
-                    'description': 'This endpoint provides access to EO data which is stored on the object storage of both CloudFerro Cloud and OpenTelekom Cloud (OTC). See the [documentation](https://documentation.dataspace.copernicus.eu/APIs/S3.html) for more information, including how to get credentials.',
-                    'platform': 'https://eodata.dataspace.copernicus.eu',
-                    'requester_pays': False,
-                    'type': 'custom-s3',
-                },
-                'creodias-s3': {
-                    'title': 'CREODIAS S3',
-                    'description': 'Comprehensive Earth Observation Data (EODATA) archive offered by CREODIAS as a commercial part of CDSE, designed to provide users with access to a vast repository of satellite data without predefined quota limits.',
-                    'platform': 'https://eodata.cloudferro.com',
-                    'requester_pays': True,
-                    'type': 'custom-s3',
-                },
-            },
-            **self.extra,
-        })
-
-        if self.odata:
-            props['auth:schemes']['oidc'] = {
+            props['eopf:origin_datetime'] = self.odata.created_isodate
+            auth_schemes['oidc'] = {
                 'type': 'openIdConnect',
                 'openIdConnectUrl': 'https://identity.dataspace.copernicus.eu/auth/realms/CDSE/.well-known/openid-configuration',
             }
-
-        if self.odata:
-            props['eopf:origin_datetime'] = self.odata.created_isodate
             extensions.add(StacExtension.EOPF)
 
+        props['auth:schemes'] = auth_schemes
+        props['storage:schemes'] = {
+            'cdse-s3': {
+                'title': 'Copernicus Data Space Ecosystem S3',
+                'description': 'This endpoint provides access to EO data which is stored on the object storage of both CloudFerro Cloud and OpenTelekom Cloud (OTC). See the [documentation](https://documentation.dataspace.copernicus.eu/APIs/S3.html) for more information, including how to get credentials.',
+                'platform': 'https://eodata.dataspace.copernicus.eu',
+                'requester_pays': False,
+                'type': 'custom-s3',
+            },
+            'creodias-s3': {
+                'title': 'CREODIAS S3',
+                'description': 'Comprehensive Earth Observation Data (EODATA) archive offered by CREODIAS as a commercial part of CDSE, designed to provide users with access to a vast repository of satellite data without predefined quota limits.',
+                'platform': 'https://eodata.cloudferro.com',
+                'requester_pays': True,
+                'type': 'custom-s3',
+            },
+        }
         props.update(self.extra)
 
-        if 'processing:software' not in props:
-            props['processing:software'] = {'eometadatatool': __version__}
-        else:
-            props['processing:software']['eometadatatool'] = __version__
-
-        if 'processing:facility' not in props and self.odata and self.odata.origin:
-            props['processing:facility'] = self.odata.origin
-
-        # Remove invalid values for relative orbit numbers, especially 0
-        if 'sat:relative_orbit' in props and not (props['sat:relative_orbit'] >= 1):
-            del props['sat:relative_orbit']
+        props.setdefault('processing:software', {})['eometadatatool'] = __version__
+        if self.odata and self.odata.origin:
+            props.setdefault('processing:facility', self.odata.origin)
 
         assets: dict[str, dict] = {
-            k: await asset.generate(self.odata, extensions, props)
+            k: (
+                asset.generate_sync(self.odata, extensions, props)
+                if asset._sync_generate
+                else await asset.generate(self.odata, extensions, props)
+            )
             for k, asset in self.assets.items()
         }
         if self.product_asset_name is not None and self.odata:
             assert self.product_asset_name not in assets, (
                 'product asset is managed automatically'
             )
-            assets[self.product_asset_name] = await ProductAsset(
+            assets[self.product_asset_name] = ProductAsset(
                 path=self.path
-            ).generate(self.odata, extensions)
-
-        if 'start_datetime' not in props and props['datetime']:
-            props['start_datetime'] = props['datetime']
+            ).generate_sync(self.odata, extensions)
 
-        if 'end_datetime' not in props and props['datetime']:
-            props['end_datetime'] = props['datetime']
+        if datetime_ := props['datetime']:
+            props.setdefault('start_datetime', datetime_)
+            props.setdefault('end_datetime', datetime_)
 
-        props['expires'] = datetime.datetime(9999,1,1,0,0,0, tzinfo=datetime.UTC).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        props['expires'] = _EXPIRES
 
         return {
             'type': 'Feature',
@@ -153,7 +141,7 @@ class STACItem:
             'id': self.identifier,
             'properties': props,
             'bbox': geom.bounds,
-            'geometry': simplify_geometry(geom).__geo_interface__,
+            'geometry': simplified_geojson(geom),
             'links': [link.generate() for link in self.links],
             'assets': assets,
             'stac_extensions': sorted(extensions),
@@ -34,13 +34,18 @@ class STACLink:
     """Additional properties."""
 
     def generate(self) -> dict[str, Any]:
-        return {
+        return self._generate(self.href)
+
+    def _generate(self, href: str) -> dict[str, Any]:
+        obj = {
             'rel': self.rel,
-            'href': self.href,
+            'href': href,
             'type': self.media_type,
             'title': self.title,
-            **self.extra,
         }
+        if self.extra:
+            obj.update(self.extra)
+        return obj
 
 
 @dataclass(kw_only=True)
@@ -52,11 +57,9 @@ class TraceabilityLink(STACLink):
     )
 
     def generate(self) -> dict[str, Any]:
-        obj = super().generate()
-        obj['href'] = (
-            f'https://trace.dataspace.copernicus.eu/api/v1/traces/name/{obj["href"]}'
+        return self._generate(
+            f'https://trace.dataspace.copernicus.eu/api/v1/traces/name/{self.href}'
         )
-        return obj
 
 @dataclass(kw_only=True)
 class ZipperLink(STACLink):
@@ -73,6 +76,4 @@ class ZipperLink(STACLink):
     )
 
     def generate(self) -> dict[str, Any]:
-        obj = super().generate()
-        obj['href'] = f'{obj["href"]}/'
-        return obj
+        return self._generate(f'{self.href}/')
@@ -2,8 +2,6 @@ import datetime
 from collections.abc import Iterator, Mapping
 from typing import Any, Final
 
-from dateutil import parser
-
 
 class _EmptyDict[K, V](Mapping[K, V]):
     def __getitem__(self, key: K) -> V:
@@ -24,8 +22,23 @@ EMPTY_MAPPING: Final[Mapping[str, Any]] = _EmptyDict()
 
 def ensure_iso_datetime(value: str | datetime.datetime) -> str | None:
     if isinstance(value, str):
-        return parser.isoparse(value).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        # already in the target YYYY-MM-DDTHH:MM:SS.ffffffZ format
+        if (
+            len(value) == 27
+            and value[4] == '-'
+            and value[10] == 'T'
+            and value[19] == '.'
+            and value[26] == 'Z'
+        ):
+            return value
+        value = datetime.datetime.fromisoformat(value)
     if isinstance(value, datetime.datetime):
         return value.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
 
     return None
+
+
+def sanitize_relative_orbit(props: dict[str, Any]) -> None:
+    """Remove invalid sat:relative_orbit values (especially 0) from item properties."""
+    if 'sat:relative_orbit' in props and not (props['sat:relative_orbit'] >= 1):
+        del props['sat:relative_orbit']
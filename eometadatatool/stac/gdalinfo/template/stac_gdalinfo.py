@@ -1,6 +1,5 @@
 import mimetypes
 from collections import Counter
-from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -22,22 +21,21 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
 
     ql_path = attr.get('ql:path')
     ql_name = attr.get('ql:name')
-    all_metapaths: list[Path] = []
     thumbnail_stacinfo: dict[str, Any] = {}
 
-    # First pass: collect all metapaths and check for thumbnail
+    # First pass: strip the .json suffix once and cache the derived path strings
+    entries: list[tuple[Path, str, str, dict[str, Any]]] = []
     metapath: Path
-    for metapath in attr['gdalinfo']:
+    gdalinfo: dict[str, Any]
+    for metapath, gdalinfo in attr['gdalinfo'].items():
         metapath = metapath.with_suffix('')  # strip .json suffix
-        all_metapaths.append(metapath)
+        entries.append((metapath, metapath.name, str(metapath), gdalinfo))
 
     # Generate simplified names for all non-thumbnail assets
-    simplified_names = _simplify_names(all_metapaths)
+    simplified_names = _simplify_names([entry[0] for entry in entries])
 
     # Second pass: create assets with simplified names
-    gdalinfo: dict[str, Any]
-    for metapath, gdalinfo in attr['gdalinfo'].items():
-        metapath = metapath.with_suffix('')  # strip .json suffix
+    for metapath, metaname, asset_path, gdalinfo in entries:
         stacinfo: dict[str, Any] = gdalinfo.get('stac', {})
 
         # Transform proj:epsg into proj:code
@@ -51,7 +49,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             stacinfo['proj:bbox'] = [*corner['lowerLeft'], *corner['upperRight']]
 
         # Store thumbnail stacinfo for later
-        if ql_name == metapath.name:
+        if ql_name == metaname:
             thumbnail_stacinfo = stacinfo
             continue
 
@@ -60,7 +58,6 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             extents.append(shape(extent))
 
         asset_name = simplified_names[metapath]
-        asset_path = str(metapath)
         assets[asset_name] = STACAsset(
             path=asset_path,
             media_type=_get_media_type(gdalinfo['driverShortName'], asset_path),
@@ -109,15 +106,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
 
 
 def _simplify_names(metapaths: list[Path]) -> dict[Path, str]:
-    stages_map: dict[Path, list[str]] = {}
-    for p in metapaths:
-        name_parts = p.name.split('.')
-        stages_map[p] = list(
-            chain(
-                ('.'.join(name_parts[: i + 1]) for i in range(len(name_parts))),
-                ('/'.join(p.parts[-i:]) for i in range(2, len(p.parts) + 1)),
-            )
-        )
+    stages_map = {p: _name_stages(p) for p in metapaths}
 
     indices = dict.fromkeys(metapaths, 0)
 
@@ -138,6 +127,27 @@ def _simplify_names(metapaths: list[Path]) -> dict[Path, str]:
                 indices[p] += 1
 
 
+def _name_stages(path: Path) -> list[str]:
+    """Candidate names for a path, from the shortest to the longest.
+
+    Dot-separated name prefixes come first, followed by growing parent path suffixes.
+    Each stage extends the previous one by a single segment.
+    """
+    name_parts = path.name.split('.')
+    stage = name_parts[0]
+    stages = [stage]
+    for part in name_parts[1:]:
+        stage = f'{stage}.{part}'
+        stages.append(stage)
+
+    parts = path.parts
+    stage = parts[-1]
+    for part in reversed(parts[:-1]):
+        stage = f'{part}/{stage}'
+        stages.append(stage)
+    return stages
+
+
 def _get_media_type(driver: str, file: str) -> str:
     """Get media type using stdlib mimetypes with GDAL driver fallbacks."""
     # First try stdlib mimetypes based on filename
@@ -1,29 +1,82 @@
 import posixpath
-import re
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
-from functools import partial
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, NamedTuple, TypeVar
 
 from shapely.geometry import shape
 
 T = TypeVar('T', str, int, float, datetime)
 
+_UTC_OFFSET = timedelta(0)
+
+
+@lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple[str, tuple[str, ...]]:
+    """Split a dotted path into its first part and the remaining parts."""
+    first, *rest = path.split('.')
+    return first, tuple(rest)
+
 
 def _get_by_path(dct: dict[str, Any], path: str) -> Any:
-    parts = path.split('.')
-    val: Any = dct.get(parts[0])
-    for p in parts[1:]:
+    if '.' not in path:
+        return dct.get(path)
+    first, rest = _split_path(path)
+    val: Any = dct.get(first)
+    for p in rest:
         if not isinstance(val, dict):
             break
         val = val.get(p)
     return val
 
 
+def _first(value: Any) -> Any:
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _coerce_str(value: Any) -> str | None:
+    if isinstance(value, list):
+        value = '&'.join(str(x) for x in value)
+    return str(value) or None
+
+
+def _coerce_int(value: Any) -> int | None:
+    value = _first(value)
+    return int(value) if value is not None else None
+
+
+def _coerce_float(value: Any) -> float | None:
+    value = _first(value)
+    return float(value) if value is not None else None
+
+
+def _coerce_datetime(value: Any) -> datetime | None:
+    value = _first(value)
+    if value is None or isinstance(value, datetime):
+        return value
+    # fromisoformat handles the 'Z' suffix natively
+    return datetime.fromisoformat(str(value))
+
+
+_TYPE_DISPATCH: dict[type, tuple[Callable[[Any], Any], str, str]] = {
+    str: (_coerce_str, '#OData.CSC.StringAttribute', 'String'),
+    int: (_coerce_int, '#OData.CSC.IntegerAttribute', 'Integer'),
+    float: (_coerce_float, '#OData.CSC.DoubleAttribute', 'Double'),
+    datetime: (
+        _coerce_datetime,
+        '#OData.CSC.DateTimeOffsetAttribute',
+        'DateTimeOffset',
+    ),
+}
+"""OData coercion function, attribute type, and value type for each supported type."""
+
+
 def _emit(
     props: dict[str, Any],
-    attrs: list[dict[str, Any]],
+    attrs: list[tuple[str, str, Any, str]],
     typ: type[T],
     name: str,
     keys: str | tuple[str, ...],
@@ -39,47 +92,27 @@ def _emit(
             if value is not None:
                 break
 
-    # If value is a list, handle generically by coercing to a scalar
-    if isinstance(value, list):
-        if typ is str:
-            value = '&'.join(str(x) for x in value) if value else None
-        elif typ in (int, float, datetime):
-            value = value[0] if value else None
-
     if value is None:
         return
 
-    # Convert type and derive OData metadata; then optionally post-transform the typed value
-    if typ is str:
-        v_typed: T = str(value)  # type: ignore[assignment]
-        if v_typed == '':
-            return
-        otype = '#OData.CSC.StringAttribute'
-        vtype = 'String'
-    elif typ is int:
-        v_typed = int(value)  # type: ignore[assignment]
-        otype = '#OData.CSC.IntegerAttribute'
-        vtype = 'Integer'
-    elif typ is float:
-        v_typed = float(value)  # type: ignore[assignment]
-        otype = '#OData.CSC.DoubleAttribute'
-        vtype = 'Double'
-    elif typ is datetime:
-        dt: datetime
-        if isinstance(value, datetime):
-            dt = value
-        else:
-            s = str(value)
-            s = s[:-1] + '+00:00' if s.endswith('Z') else s
-            dt = datetime.fromisoformat(s)
-        v_typed = dt  # type: ignore[assignment]
-        otype = '#OData.CSC.DateTimeOffsetAttribute'
-        vtype = 'DateTimeOffset'
-    else:
+    # Convert type (coercing lists to a scalar) and derive OData metadata;
+    # then optionally post-transform the typed value
+    dispatch = _TYPE_DISPATCH.get(typ)
+    if dispatch is None:
         raise ValueError('Unsupported type')
+    coerce, otype, vtype = dispatch
+    v_typed: T | None = coerce(value)
+    if v_typed is None:
+        return
 
     if transform is not None:
-        transformed = transform(v_typed)
+        # Call the common case-folding transforms directly on the string
+        if transform is str.upper:
+            transformed = v_typed.upper()  # type: ignore[union-attr]
+        elif transform is str.lower:
+            transformed = v_typed.lower()  # type: ignore[union-attr]
+        else:
+            transformed = transform(v_typed)
         if (typ is str and not transformed) or transformed is None:
             return
         v_typed = transformed
@@ -88,33 +121,26 @@ def _emit(
     if typ is datetime:
         v_out: Any
         dt_out: datetime = v_typed  # type: ignore[assignment]
-        if dt_out.tzinfo is not None and dt_out.utcoffset() == timedelta(0):
-            v_out = dt_out.replace(tzinfo=UTC).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        if dt_out.tzinfo is not None and dt_out.utcoffset() == _UTC_OFFSET:
+            v_out = dt_out.replace(tzinfo=None).isoformat(timespec='microseconds') + 'Z'
         else:
             v_out = dt_out.isoformat()
     else:
         v_out = v_typed
 
-    attrs.append({
-        '@odata.type': otype,
-        'Name': name,
-        'Value': v_out,
-        'ValueType': vtype,
-    })
+    attrs.append((otype, name, v_out, vtype))
+
+
+_PLATFORM_SERIAL_IDENTIFIERS: dict[str, str] = {
+    f'{number}{serial}': serial.upper() for number in '1236' for serial in 'abc'
+}
+"""Accepted sentinel-[1236][abc] platform suffixes → A/B/C"""
 
 
 def _platform_serial_identifier(platform: str | None) -> str | None:
     if not platform:
         return None
-    # Accept only sentinel-[1236][abc] → A/B/C
-    suffix = platform.rsplit('-', 1)[-1]
-    if (
-        len(suffix) == 2
-        and suffix[0] in {'1', '2', '3', '6'}
-        and suffix[1] in {'a', 'b', 'c'}
-    ):
-        return suffix[1].upper()
-    return None
+    return _PLATFORM_SERIAL_IDENTIFIERS.get(platform.rsplit('-', 1)[-1])
 
 
 def s3path_from_stac(stac: dict[str, Any]) -> Path | None:
@@ -133,7 +159,134 @@ def s3path_from_stac(stac: dict[str, Any]) -> Path | None:
     if not s3_paths:
         return None
 
-    return Path(posixpath.commonpath(s3_paths).rstrip('/'))
+    # Character-wise common prefix, trimmed back to a path component boundary
+    prefix = posixpath.commonprefix(s3_paths)
+    n = len(prefix)
+    if any(len(path) > n and path[n] != '/' for path in s3_paths):
+        prefix = prefix[: prefix.rfind('/') + 1]
+    return Path(prefix.rstrip('/'))
+
+
+def _wkt_number(value: float) -> str | None:
+    # Match the GEOS WKT writer: shortest round-trip digits in fixed notation,
+    # without a trailing '.0'; anything needing exponent notation is left to GEOS
+    if value == 0:
+        return '0'  # GEOS writes -0.0 as '0'
+    text = repr(float(value))
+    if 'e' in text or 'n' in text:
+        return None
+    integer, _, fraction = text.partition('.')
+    if len(fraction) > 16:
+        return None
+    return integer if fraction == '0' else text
+
+
+def _wkt_coord(coord: list[float]) -> str | None:
+    if len(coord) != 2:
+        return None
+    x = _wkt_number(coord[0])
+    y = _wkt_number(coord[1])
+    return f'{x} {y}' if x is not None and y is not None else None
+
+
+def _wkt_ring(ring: list[list[float]]) -> str | None:
+    if len(ring) < 4 or ring[0] != ring[-1]:
+        return None
+    parts: list[str] = []
+    for coord in ring:
+        if (part := _wkt_coord(coord)) is None:
+            return None
+        parts.append(part)
+    return f'({", ".join(parts)})'
+
+
+def _wkt_polygon(rings: list[list[list[float]]]) -> str | None:
+    if not rings:
+        return None
+    parts: list[str] = []
+    for ring in rings:
+        if (part := _wkt_ring(ring)) is None:
+            return None
+        parts.append(part)
+    return f'({", ".join(parts)})'
+
+
+def _wkt_from_geojson(geometry: dict[str, Any]) -> str:
+    """Format simple 2D GeoJSON geometries as WKT, falling back to Shapely."""
+    typ = geometry.get('type')
+    coords = geometry.get('coordinates')
+    wkt: str | None = None
+    if typ == 'Polygon' and coords:
+        if (body := _wkt_polygon(coords)) is not None:
+            wkt = f'POLYGON {body}'
+    elif typ == 'MultiPolygon' and coords:
+        parts: list[str] = []
+        for polygon in coords:
+            if (body := _wkt_polygon(polygon)) is None:
+                break
+            parts.append(body)
+        else:
+            wkt = f'MULTIPOLYGON ({", ".join(parts)})'
+    elif typ == 'Point' and coords and (body := _wkt_coord(coords)) is not None:
+        wkt = f'POINT ({body})'
+    return wkt if wkt is not None else shape(geometry).wkt
+
+
+def _s1_processing_level(level: str) -> str:
+    return 'LEVEL' + level.removeprefix('L') if level.startswith('L') else level
+
+
+def _s3_processing_level(level: str) -> str:
+    return level.removeprefix('L')
+
+
+def _strip_mgrs_prefix(tile_id: str) -> str:
+    return tile_id[5:] if tile_id.upper().startswith('MGRS-') else tile_id
+
+
+class _Mission(NamedTuple):
+    orbit_emits: tuple[tuple[Any, ...], ...] = ()
+    """Additional emit() arguments for the orbit and acquisition section."""
+
+    product_emits: tuple[tuple[Any, ...], ...] = ()
+    """Additional emit() arguments for the product and collection section."""
+
+    facility_field: str | None = None
+    """OData attribute name for processing:facility, None to skip."""
+
+    processing_level_key: str = 'processing:level'
+    """STAC property holding the processing level."""
+
+    processing_level_transform: Callable[[str], str] | None = None
+    """Transform applied to the processing level."""
+
+
+_DEFAULT_MISSION = _Mission()
+
+_MISSIONS: dict[str, _Mission] = {
+    'sentinel-1': _Mission(
+        orbit_emits=(
+            (int, 'datatakeID', 'eopf:datatake_id'),
+            (int, 'instrumentConfigurationID', 'eopf:instrument_configuration_id'),
+        ),
+        facility_field='origin',
+        processing_level_transform=_s1_processing_level,
+    ),
+    'sentinel-2': _Mission(
+        product_emits=(
+            (str, 'datastripId', 'eopf:datastrip_id'),
+            (str, 'productGroupId', 'eopf:datatake_id'),
+            (str, 'tileId', 'grid:code', _strip_mgrs_prefix),
+        ),
+        facility_field='origin',
+        processing_level_key='product:type',
+    ),
+    'sentinel-3': _Mission(
+        facility_field='processingCenter',
+        processing_level_transform=_s3_processing_level,
+    ),
+}
+"""Constellation-specific emit() configuration, resolved once per render."""
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
@@ -141,27 +294,43 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
     props: dict[str, Any] = stac_data['properties']
     assets: dict[str, dict] = stac_data['assets']
     geometry: dict[str, Any] = stac_data['geometry']
-    attributes: list[dict[str, Any]] = []
+    attributes: list[tuple[str, str, Any, str]] = []
 
     # -- Prepare
     s3path = p.as_posix() if (p := s3path_from_stac(stac_data)) is not None else None
 
-    # Extract suffix from file:local_path (e.g., ".SAFE")
-    stac_id = stac_data['id']
+    # Single pass over the assets: find the product asset (top-level local path)
+    # and extract the name suffix from file:local_path (e.g., ".SAFE")
+    stac_id: str = stac_data['id']
+    stac_id_found = False
+    product: dict[str, Any] | None = None
     for asset in assets.values():
-        local_path: str = asset.get('file:local_path', '')
-        if local_path.startswith(stac_id):
+        local_path: str | None = asset.get('file:local_path')
+        if local_path is None:
+            continue
+        if product is None and '/' not in local_path:
+            product = asset
+        if not stac_id_found and local_path.startswith(stac_id):
             i = local_path.find('/', len(stac_id))
             stac_id = local_path[:i] if i != -1 else local_path
+            stac_id_found = True
+        if product is not None and stac_id_found:
             break
-
-    emit = partial(_emit, props, attributes)
-
-    # -- Mission flags
-    constellation = (props.get('constellation') or '').lower()
-    is_s1 = constellation == 'sentinel-1'
-    is_s2 = constellation == 'sentinel-2'
-    is_s3 = constellation == 'sentinel-3'
+    if product is None:
+        raise ValueError(f'Product asset not found in {stac_data["id"]!r}')
+
+    def emit(
+        typ: type[T],
+        name: str,
+        keys: str | tuple[str, ...],
+        transform: Callable[[T], T | None] | None = None,
+    ) -> None:
+        _emit(props, attributes, typ, name, keys, transform)
+
+    # -- Mission specifics
+    mission = _MISSIONS.get(
+        (props.get('constellation') or '').lower(), _DEFAULT_MISSION
+    )
 
     # -- Identity and platform
     emit(str, 'instrumentShortName', 'instruments', transform=str.upper)
@@ -179,39 +348,26 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
     emit(str, 'orbitDirection', 'sat:orbit_state', transform=str.upper)
     emit(int, 'orbitNumber', 'sat:absolute_orbit')
     emit(int, 'relativeOrbitNumber', 'sat:relative_orbit')
-    if is_s1:
-        emit(int, 'datatakeID', 'eopf:datatake_id')
-        emit(int, 'instrumentConfigurationID', 'eopf:instrument_configuration_id')
+    for args in mission.orbit_emits:
+        emit(*args)
 
     # -- Product & collection
     emit(float, 'cloudCover', 'eo:cloud_cover')
     emit(str, 'polarisationChannels', 'sar:polarizations', transform=str.upper)
     emit(str, 'productType', 'product:type')
     emit(str, 'swathIdentifier', 'sar:instrument_mode')
-    if is_s2:
-        emit(str, 'datastripId', 'eopf:datastrip_id')
-        emit(str, 'productGroupId', 'eopf:datatake_id')
-        emit(
-            str,
-            'tileId',
-            'grid:code',
-            transform=lambda s: (s[5:] if s.upper().startswith('MGRS-') else s),
-        )
+    for args in mission.product_emits:
+        emit(*args)
 
     # -- Processing metadata
-    field = 'processingCenter' if is_s3 else ('origin' if (is_s1 or is_s2) else None)
-    if field:
-        emit(str, field, 'processing:facility')
+    if mission.facility_field is not None:
+        emit(str, mission.facility_field, 'processing:facility')
     emit(datetime, 'processingDate', 'processing:datetime')
     emit(
         str,
         'processingLevel',
-        'product:type' if is_s2 else 'processing:level',
-        transform=(
-            (lambda s: 'LEVEL' + s.removeprefix('L') if s.startswith('L') else s)
-            if is_s1
-            else ((lambda s: s.removeprefix('L')) if is_s3 else None)
-        ),
+        mission.processing_level_key,
+        transform=mission.processing_level_transform,
     )
     emit(str, 'processorVersion', 'processing:version')
     emit(str, 'timeliness', ('product:timeliness_category', 'product:timeliness'))
@@ -230,21 +386,20 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
     emit(datetime, 'beginningDateTime', ('start_datetime', 'datetime'))
     emit(datetime, 'endingDateTime', ('end_datetime', 'datetime'))
 
-    product: dict[str, Any] = next(
-        asset
-        for asset in assets.values()
-        if '/' not in asset.get('file:local_path', '/')
-    )
-
     origin_date = props.get('created', start_date)
     publication_date = props.get('published') or props.get('updated', start_date)
     modification_date = props.get('updated') or props.get('created', start_date)
 
     odata_assets: list[dict] = []
     if thumb := assets.get('thumbnail'):
+        thumb_href: str = thumb['href']
+        _, found, thumb_id = thumb_href.partition('Assets(')
+        thumb_id, found_end, _ = thumb_id.partition(')')
+        if not found or not found_end:
+            raise ValueError(f'Asset id not found in thumbnail href {thumb_href!r}')
         thumb_asset = {
-            'DownloadLink': thumb['href'],
-            'Id': re.search(r'Assets\((.*?)\)', thumb['href']).group(1),  # type: ignore
+            'DownloadLink': thumb_href,
+            'Id': thumb_id,
             'Type': 'QUICKLOOK',
         }
         if s3path is not None:
@@ -262,9 +417,17 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         'Online': True,
         'EvictionDate': '9999-12-31T23:59:59.999999Z',
         'ContentDate': {'Start': start_date, 'End': end_date},
-        'Footprint': f"geography'SRID=4326;{shape(geometry).wkt}'",
+        'Footprint': f"geography'SRID=4326;{_wkt_from_geojson(geometry)}'",
         'GeoFootprint': geometry,
-        'Attributes': attributes,
+        'Attributes': [
+            {
+                '@odata.type': otype,
+                'Name': name,
+                'Value': value,
+                'ValueType': vtype,
+            }
+            for otype, name, value, vtype in attributes
+        ],
         'Assets': odata_assets,
     }
 
@@ -288,24 +451,29 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _uvarint(data: bytes, i: int) -> tuple[int, int]:
+    """Decode an unsigned varint at the given index. Return the value and the next index."""
+    val = 0
+    shift = 0
+    while True:
+        byte = data[i]
+        i += 1
+        val |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return val, i
+        shift += 7
+
+
 def _parse_multihash(mh: str) -> tuple[str, str]:
     b = bytes.fromhex(mh)
-    i = 0
-
-    def _uvarint(data: bytes, j: int) -> tuple[int, int]:
-        val = 0
-        shift = 0
-        while True:
-            byte = data[j]
-            j += 1
-            val |= (byte & 0x7F) << shift
-            if (byte & 0x80) == 0:
-                break
-            shift += 7
-        return val, j
-
-    code, i = _uvarint(b, i)
-    length, i = _uvarint(b, i)
+    if b[0] < 0x80 and b[1] < 0x80:
+        # fast path: single-byte function code and digest length
+        code = b[0]
+        length = b[1]
+        i = 2
+    else:
+        code, i = _uvarint(b, 0)
+        length, i = _uvarint(b, i)
     digest = b[i : i + length]
     algo = _MULTIHASH_CODEC_MAP[code]
     assert len(digest) == length
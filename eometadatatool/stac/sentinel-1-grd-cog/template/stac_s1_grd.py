@@ -15,14 +15,34 @@ from eometadatatool.stac.framework.stac_link import (
     TraceabilityLink,
     ZipperLink,
 )
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
+
+_TIMELINESS: dict[str, str] = {
+    'Fast-24h': 'PT24H',
+    'NRT-10m': 'PT10M',
+    'NRT-3h': 'PT3H',
+}
+"""Timeliness category → product:timeliness duration."""
+
+_SAR_RESOLUTION: dict[str, tuple[int, int]] = {
+    'iw': (5, 20),
+    'ew': (20, 40),
+    'sm': (5, 5),
+}
+"""Instrument mode → (sar:resolution_range, sar:resolution_azimuth)."""
+
+_S1_ASSETS = generate_bands(S1_Assets, None)
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
-    polarizations = []
-    if attr.get('polarisationChannel:1') is not None:
-        polarizations.append(attr['polarisationChannel:1'])
-    if attr.get('polarisationChannel:2') is not None:
-        polarizations.append(attr['polarisationChannel:2'])
+    polarizations: list[str] = [
+        pol
+        for pol in (
+            attr.get('polarisationChannel:1'),
+            attr.get('polarisationChannel:2'),
+        )
+        if pol is not None
+    ]
     props = {
         'platform': f'sentinel-1{attr["platformSerialIdentifier"].lower()}',
         'constellation': attr['platformShortName'].lower(),
@@ -52,24 +72,13 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         'eopf:datatake_id': attr['datatakeID'],
         'eopf:instrument_configuration_id': attr['instrumentConfigurationID'],
     }
-    if attr['timeliness'] == 'Fast-24h':
-        props['product:timeliness'] = 'PT24H'
-        props['product:timeliness_category'] = 'Fast-24h'
-    elif attr['timeliness'] == 'NRT-10m':
-        props['product:timeliness'] = 'PT10M'
-        props['product:timeliness_category'] = 'NRT-10m'
-    elif attr['timeliness'] == 'NRT-3h':
-        props['product:timeliness'] = 'PT3H'
-        props['product:timeliness_category'] = 'NRT-3h'
-    if attr['operationalMode'] == 'iw':
-        props['sar:resolution_range'] = 5
-        props['sar:resolution_azimuth'] = 20
-    elif attr['operationalMode'] == 'ew':
-        props['sar:resolution_range'] = 20
-        props['sar:resolution_azimuth'] = 40
-    elif attr['operationalMode'] == 'sm':
-        props['sar:resolution_range'] = 5
-        props['sar:resolution_azimuth'] = 5
+    sanitize_relative_orbit(props)
+    timeliness: str = attr['timeliness']
+    if (timeliness_duration := _TIMELINESS.get(timeliness)) is not None:
+        props['product:timeliness'] = timeliness_duration
+        props['product:timeliness_category'] = timeliness
+    if (resolution := _SAR_RESOLUTION.get(attr['operationalMode'])) is not None:
+        props['sar:resolution_range'], props['sar:resolution_azimuth'] = resolution
 
     item_path: str = attr['filepath']
     odata = await get_odata_id(item_path)
@@ -92,11 +101,11 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         ),
     }
 
+    mode = attr['swathIdentifier'].lower()
     for pol in polarizations:
         pol = pol.lower()
         pol_uc = pol.upper()
-        mode = attr['swathIdentifier'].lower()
-        for asset_id in generate_bands(S1_Assets, None):
+        for asset_id in _S1_ASSETS:
             asset_key = f'asset:{mode}:{pol}:{asset_id["short_name"]}'
             assets[f'{asset_id["name"]}-{pol}'] = XMLAsset(
                 path=f'{item_path}{attr[asset_key]}',
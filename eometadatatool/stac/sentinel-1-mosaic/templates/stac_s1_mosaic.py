@@ -15,12 +15,19 @@ from eometadatatool.stac.framework.stac_link import (
     ZipperLink,
 )
 
+_MODE_POLARIZATIONS: dict[str, tuple[str, ...]] = {
+    'IW': ('VH', 'VV'),
+    'DH': ('HH', 'HV'),
+}
+
+_S1_BANDS = tuple(zip(S1_Pols, generate_bands(S1_Pols, None), strict=True))
+
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
     parts = attr['filename'].split('_')
     mode = parts[1]
     mgrs = parts[5]
-    polarizations = {'IW': ['VH', 'VV'], 'DH': ['HH', 'HV']}
+    polarizations = _MODE_POLARIZATIONS[mode]
 
     extensions = {
         StacExtension.SAR,
@@ -45,7 +52,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         'sar:instrument_mode': mode,
         'sar:frequency_band': 'C',
         'sar:center_frequency': 5.405,
-        'sar:polarizations': polarizations[mode],
+        'sar:polarizations': polarizations,
         'gsd': 20 if mode == 'IW' else 40,
     }
 
@@ -67,8 +74,8 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         )
     }
 
-    for band_id, band in zip(S1_Pols, generate_bands(S1_Pols, None), strict=True):
-        if band_id in polarizations[mode]:
+    for band_id, band in _S1_BANDS:
+        if band_id in polarizations:
             extra = {
                 'data_type': 'float32',
                 'nodata': -32768,
@@ -12,19 +12,35 @@ from eometadatatool.stac.framework.stac_bands import S1_Pols
 from eometadatatool.stac.framework.stac_extension import StacExtension
 from eometadatatool.stac.framework.stac_item import STACItem
 from eometadatatool.stac.framework.stac_link import TraceabilityLink
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
+
+_TIMELINESS: dict[str, str] = {
+    'Fast-24h': 'PT24H',
+    'NRT-10m': 'PT10M',
+    'NRT-3h': 'PT3H',
+}
+"""Timeliness category → product:timeliness duration."""
+
+_SAR_RESOLUTION: dict[str, tuple[int, int]] = {
+    'iw': (5, 20),
+    'sm': (5, 5),
+    'ew': (20, 40),
+}
+"""Instrument mode → (sar:resolution_range, sar:resolution_azimuth)."""
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
     item_path: str = attr['filepath']
     odata = await get_odata_id(item_path)
     mode: str = attr['operationalMode'].lower()
-    pols: list[str] = []
-    pol_ch1 = attr.get('polarisationChannel:1')
-    if pol_ch1 is not None:
-        pols.append(pol_ch1.lower())
-    pol_ch2 = attr.get('polarisationChannel:2')
-    if pol_ch2 is not None:
-        pols.append(pol_ch2.lower())
+    pols: list[str] = [
+        pol.lower()
+        for pol in (
+            attr.get('polarisationChannel:1'),
+            attr.get('polarisationChannel:2'),
+        )
+        if pol is not None
+    ]
 
     props: dict[str, Any] = {
         'datetime': attr['beginningDateTime'],
@@ -55,16 +71,10 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         'eopf:datatake_id': str(attr['datatakeID']),
         'eopf:instrument_configuration_id': attr['instrumentConfigurationID'],
     }
+    sanitize_relative_orbit(props)
 
-    if mode == 'iw':
-        props['sar:resolution_range'] = 5
-        props['sar:resolution_azimuth'] = 20
-    elif mode == 'sm':
-        props['sar:resolution_range'] = 5
-        props['sar:resolution_azimuth'] = 5
-    elif mode == 'ew':
-        props['sar:resolution_range'] = 20
-        props['sar:resolution_azimuth'] = 40
+    if (resolution := _SAR_RESOLUTION.get(mode)) is not None:
+        props['sar:resolution_range'], props['sar:resolution_azimuth'] = resolution
 
     # Build assets dictionary
     assets: dict[str, STACAsset] = {
@@ -80,18 +90,34 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
     # Add core product assets
     # Process measurement data for each mode/polarization
     for beam, pol in product(['wv1', 'wv2'], pols):
-        prod = attr[f'asset:{beam}:{pol}:product']
-        prod_checksum = attr[f'asset:{beam}:{pol}:product:checksum']
-        prod_size = attr[f'asset:{beam}:{pol}:product:size']
-        calib = attr[f'asset:{beam}:{pol}:calibration']
-        calib_checksum = attr[f'asset:{beam}:{pol}:calibration:checksum']
-        calib_size = attr[f'asset:{beam}:{pol}:calibration:size']
-        noise = attr[f'asset:{beam}:{pol}:noises']
-        noise_checksum = attr[f'asset:{beam}:{pol}:noises:checksum']
-        noise_size = attr[f'asset:{beam}:{pol}:noises:size']
-        measure = attr[f'asset:{beam}:{pol}:measurement']
-        measure_checksum = attr[f'asset:{beam}:{pol}:measurement:checksum']
-        measure_size = attr[f'asset:{beam}:{pol}:measurement:size']
+        key = f'{beam}:{pol}'
+        prefix = f'asset:{key}:'
+        prod = attr[prefix + 'product']
+        prod_checksum = attr[prefix + 'product:checksum']
+        prod_size = attr[prefix + 'product:size']
+        calib = attr[prefix + 'calibration']
+        calib_checksum = attr[prefix + 'calibration:checksum']
+        calib_size = attr[prefix + 'calibration:size']
+        noise = attr[prefix + 'noises']
+        noise_checksum = attr[prefix + 'noises:checksum']
+        noise_size = attr[prefix + 'noises:size']
+        measure = attr[prefix + 'measurement']
+        measure_checksum = attr[prefix + 'measurement:checksum']
+        measure_size = attr[prefix + 'measurement:size']
+        shape1 = attr[f'shape1:{key}']
+        shape2 = attr[f'shape2:{key}']
+        looks_range = attr[f'looksRange:{key}']
+        looks_azimuth = attr[f'looksAzimuth:{key}']
+        range_pixel_spacing = attr[f'rangePixelSpacing:{key}']
+        azimuth_pixel_spacing = attr[f'azimuthPixelSpacing:{key}']
+        incidence_angle = attr[f'incidenceAngleMid:{key}']
+        azimuth_angle = attr[f'azimuthAngle:{key}']
+
+        pol_upper = pol.upper()
+        pol_meta = S1_Pols[pol_upper]
+        product_title = f'{pol_upper} Product Schema'
+        calibration_title = f'{pol_upper} calibration Schema'
+        noise_title = f'{pol_upper} noise Schema'
 
         for j in range(len(prod)):
             swath_id = prod[j][-7:-4]  # sequence number before the extension
@@ -99,7 +125,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             # Product
             assets[f'schema-product-{beam}-{pol}-{swath_id}'] = XMLAsset(
                 path=f'{item_path}/{prod[j]}',
-                title=f'{pol.upper()} Product Schema',
+                title=product_title,
                 description="Main source of band's metadata, including: state of the platform during acquisition, image properties, Doppler information, geographic location, etc.",
                 roles=('metadata', beam),
                 checksum=prod_checksum[j],
@@ -109,7 +135,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             # Calibration
             assets[f'schema-calibration-{beam}-{pol}-{swath_id}'] = XMLAsset(
                 path=f'{item_path}/{calib[j]}',
-                title=f'{pol.upper()} calibration Schema',
+                title=calibration_title,
                 description='Calibration metadata including calibration details and lookup tables for beta nought, sigma nought, gamma, and digital numbers used in absolute product calibration.',
                 roles=('metadata', beam),
                 checksum=calib_checksum[j],
@@ -119,7 +145,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             # Noise
             assets[f'schema-noise-{beam}-{pol}-{swath_id}'] = XMLAsset(
                 path=f'{item_path}/{noise[j]}',
-                title=f'{pol.upper()} noise Schema',
+                title=noise_title,
                 description='Estimated thermal noise look-up tables',
                 roles=('metadata', beam),
                 checksum=noise_checksum[j],
@@ -129,31 +155,22 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             # Measurement
             assets[f'{beam}-{pol}-{swath_id}'] = CloudOptimizedGeoTIFFAsset(
                 path=f'{item_path}/{measure[j]}',
-                title=S1_Pols[pol.upper()]['title'],
-                description=S1_Pols[pol.upper()]['description'],
+                title=pol_meta['title'],
+                description=pol_meta['description'],
                 roles=('data', beam),
                 checksum=measure_checksum[j],
                 size=measure_size[j],
                 extra={
                     'data_type': 'cint16',
                     'proj:code': None,
-                    'proj:shape': [
-                        attr[f'shape1:{beam}:{pol}'][j],
-                        attr[f'shape2:{beam}:{pol}'][j],
-                    ],
-                    'sar:polarizations': [pol.upper()],
-                    'sar:looks_range': attr[f'looksRange:{beam}:{pol}'][j],
-                    'sar:looks_azimuth': attr[f'looksAzimuth:{beam}:{pol}'][j],
-                    'sar:pixel_spacing_range': attr[f'rangePixelSpacing:{beam}:{pol}'][
-                        j
-                    ],
-                    'sar:pixel_spacing_azimuth': attr[
-                        f'azimuthPixelSpacing:{beam}:{pol}'
-                    ][j],
-                    'view:incidence_angle': attr[f'incidenceAngleMid:{beam}:{pol}'][j],
-                    'view:azimuth': normalize_angle(
-                        attr[f'azimuthAngle:{beam}:{pol}'][j]
-                    ),
+                    'proj:shape': [shape1[j], shape2[j]],
+                    'sar:polarizations': [pol_upper],
+                    'sar:looks_range': looks_range[j],
+                    'sar:looks_azimuth': looks_azimuth[j],
+                    'sar:pixel_spacing_range': range_pixel_spacing[j],
+                    'sar:pixel_spacing_azimuth': azimuth_pixel_spacing[j],
+                    'view:incidence_angle': incidence_angle[j],
+                    'view:azimuth': normalize_angle(azimuth_angle[j]),
                 },
             )
 
@@ -185,11 +202,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
 
 
 def _get_timeliness(timeliness: str) -> str:
-    match timeliness:
-        case 'Fast-24h':
-            return 'PT24H'
-        case 'NRT-10m':
-            return 'PT10M'
-        case 'NRT-3h':
-            return 'PT3H'
-    raise ValueError(f'Unsupported timeliness {timeliness!r}')
+    try:
+        return _TIMELINESS[timeliness]
+    except KeyError:
+        raise ValueError(f'Unsupported timeliness {timeliness!r}') from None
@@ -1,7 +1,7 @@
 from itertools import product
 from typing import Any
 
-from eometadatatool.dlc import format_baseline, get_odata_id, normalize_angle
+from eometadatatool.dlc import format_baseline, normalize_angle, overlap_odata
 from eometadatatool.stac.framework.stac_asset import (
     CloudOptimizedGeoTIFFAsset,
     ProductManifestAsset,
@@ -13,29 +13,130 @@ from eometadatatool.stac.framework.stac_bands import S1_Pols
 from eometadatatool.stac.framework.stac_extension import StacExtension
 from eometadatatool.stac.framework.stac_item import STACItem
 from eometadatatool.stac.framework.stac_link import TraceabilityLink
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
+
+_TIMELINESS: dict[str, str] = {
+    'Fast-24h': 'PT24H',
+    'NRT-10m': 'PT10M',
+    'NRT-3h': 'PT3H',
+}
+"""Timeliness category → product:timeliness duration."""
+
+_SAR_RESOLUTION: dict[str, dict[str, int]] = {
+    'iw': {'sar:resolution_range': 5, 'sar:resolution_azimuth': 20},
+    'sm': {'sar:resolution_range': 5, 'sar:resolution_azimuth': 5},
+    'ew': {'sar:resolution_range': 20, 'sar:resolution_azimuth': 40},
+}
+"""Instrument mode → sar:resolution_range and sar:resolution_azimuth properties."""
+
+_MODE_BEAMS: dict[str, tuple[str, ...]] = {
+    'iw': ('iw1', 'iw2', 'iw3'),
+    'ew': ('ew1', 'ew2', 'ew3', 'ew4', 'ew5'),
+}
+"""Instrument mode → beam ids, except for stripmap which depends on the product."""
+
+_REQUIRED_KEYS: frozenset[str] = frozenset((
+    'anxTime',
+    'beginningDateTime',
+    'coordinates',
+    'cycleNumber',
+    'datatakeID',
+    'endingDateTime',
+    'filename',
+    'filepath',
+    'identifier',
+    'instrumentConfigurationID',
+    'instrumentShortName',
+    'manifest.safe:checksum:MD5',
+    'manifest.safe:size',
+    'operationalMode',
+    'orbitDirection',
+    'orbitNumber',
+    'platformIdentifier',
+    'platformSerialIdentifier',
+    'platformShortName',
+    'processingCenter',
+    'processingDate',
+    'processorName',
+    'processorVersion',
+    'relativeOrbitNumber',
+    'timeliness',
+))
+"""Attributes that every product must provide, checked before rendering starts."""
+
+_SCHEMA_ASSETS: tuple[tuple[str, str, str, str], ...] = (
+    (
+        'product',
+        'Product Schema',
+        "Main source of band's metadata, including: state of the platform during acquisition, image properties, Doppler information, geographic location, etc.",
+        'product',
+    ),
+    (
+        'calibration',
+        'calibration Schema',
+        'Calibration metadata including calibration details and lookup tables for beta nought, sigma nought, gamma, and digital numbers used in absolute product calibration.',
+        'calibration',
+    ),
+    (
+        'noise',
+        'noise Schema',
+        'Estimated thermal noise look-up tables',
+        'noises',
+    ),
+)
+"""(asset name, title suffix, description, attribute name) of the XML schema assets."""
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
-    def mode_beams(mode: str) -> list[str]:
-        match mode:
-            case 'iw':
-                return ['iw1', 'iw2', 'iw3']
-            case 'sm':
-                return ['s' + attr['filename'][5]]
-            case 'ew':
-                return ['ew1', 'ew2', 'ew3', 'ew4', 'ew5']
-        raise ValueError(f'Unsupported mode beams {mode!r}')
+    if missing := _REQUIRED_KEYS.difference(attr):
+        raise KeyError(f'Missing attributes: {", ".join(sorted(missing))}')
 
     item_path: str = attr['filepath']
-    odata = await get_odata_id(item_path)
+    odata, (props, assets) = await overlap_odata(
+        item_path, _props_and_assets, attr, item_path
+    )
+
+    item = STACItem(
+        path=attr['filepath'],
+        odata=odata,
+        collection='sentinel-1-slc',
+        identifier=attr['identifier'],
+        coordinates=attr['coordinates'],
+        links=[
+            TraceabilityLink(
+                href=f'{attr["filename"]}.zip',
+            )
+        ],
+        assets=assets,
+        extensions=(
+            StacExtension.SATELLITE,
+            StacExtension.PROCESSING,
+            StacExtension.PRODUCT,
+            StacExtension.PROJECTION,
+            StacExtension.SAR,
+            StacExtension.VIEW,
+            StacExtension.EOPF,
+        ),
+        extra=props,
+    )
+
+    return await item.generate()
+
+
+def _props_and_assets(
+    attr: dict[str, Any], item_path: str
+) -> tuple[dict[str, Any], dict[str, STACAsset]]:
     mode: str = attr['operationalMode'].lower()
-    pols: list[str] = []
-    pol_ch1 = attr.get('polarisationChannel:1')
-    if pol_ch1 is not None:
-        pols.append(pol_ch1.lower())
-    pol_ch2 = attr.get('polarisationChannel:2')
-    if pol_ch2 is not None:
-        pols.append(pol_ch2.lower())
+    beams = _mode_beams(mode, attr['filename'])
+    pols: list[str] = [
+        pol.lower()
+        for pol in (
+            attr.get('polarisationChannel:1'),
+            attr.get('polarisationChannel:2'),
+        )
+        if pol is not None
+    ]
+    pols_upper = [pol.upper() for pol in pols]
 
     props: dict[str, Any] = {
         'datetime': attr['beginningDateTime'],
@@ -61,21 +162,13 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         'sar:frequency_band': 'C',
         'sar:center_frequency': 5.405,
         'sar:instrument_mode': mode.upper(),
-        'sar:beam_ids': mode_beams(mode),
-        'sar:polarizations': [p.upper() for p in pols],
+        'sar:beam_ids': beams,
+        'sar:polarizations': pols_upper,
         'eopf:datatake_id': str(attr['datatakeID']),
         'eopf:instrument_configuration_id': attr['instrumentConfigurationID'],
+        **_SAR_RESOLUTION.get(mode, {}),
     }
-
-    if mode == 'iw':
-        props['sar:resolution_range'] = 5
-        props['sar:resolution_azimuth'] = 20
-    elif mode == 'sm':
-        props['sar:resolution_range'] = 5
-        props['sar:resolution_azimuth'] = 5
-    elif mode == 'ew':
-        props['sar:resolution_range'] = 20
-        props['sar:resolution_azimuth'] = 40
+    sanitize_relative_orbit(props)
 
     # Build assets dictionary
     assets: dict[str, STACAsset] = {
@@ -89,104 +182,67 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
     }
 
     # Check if product has thumbnail
-    thumb_size = attr.get('thumbnail.png:size', 0)
-    if thumb_size > 0:
+    if thumb_size := attr.get('thumbnail.png:size'):
         assets['thumbnail'] = ThumbnailAsset(
             path=f'{item_path}/preview/thumbnail.png',
             checksum=attr.get('thumbnail.png:checksum'),
-            size=attr.get('thumbnail.png:size'),
+            size=thumb_size,
         )
 
     # Process measurement data for each mode/polarization
-    for beam, pol in product(mode_beams(mode), pols):
-        # Product
-        assets[f'schema-product-{beam}-{pol}'] = XMLAsset(
-            path=f'{item_path}/{attr[f"asset:{beam}:{pol}:product"]}',
-            title=f'{pol.upper()} Product Schema',
-            description="Main source of band's metadata, including: state of the platform during acquisition, image properties, Doppler information, geographic location, etc.",
-            roles=('metadata', beam),
-            checksum=attr[f'asset:{beam}:{pol}:product:checksum'],
-            size=attr[f'asset:{beam}:{pol}:product:size'],
-        )
-
-        # Calibration
-        assets[f'schema-calibration-{beam}-{pol}'] = XMLAsset(
-            path=f'{item_path}/{attr[f"asset:{beam}:{pol}:calibration"]}',
-            title=f'{pol.upper()} calibration Schema',
-            description='Calibration metadata including calibration details and lookup tables for beta nought, sigma nought, gamma, and digital numbers used in absolute product calibration.',
-            roles=('metadata', beam),
-            checksum=attr[f'asset:{beam}:{pol}:calibration:checksum'],
-            size=attr[f'asset:{beam}:{pol}:calibration:size'],
-        )
-
-        # Noise
-        assets[f'schema-noise-{beam}-{pol}'] = XMLAsset(
-            path=f'{item_path}/{attr[f"asset:{beam}:{pol}:noises"]}',
-            title=f'{pol.upper()} noise Schema',
-            description='Estimated thermal noise look-up tables',
-            roles=('metadata', beam),
-            checksum=attr[f'asset:{beam}:{pol}:noises:checksum'],
-            size=attr[f'asset:{beam}:{pol}:noises:size'],
-        )
+    base = item_path + '/'
+    for beam, (pol, pol_upper) in product(beams, zip(pols, pols_upper, strict=True)):
+        key = f'{beam}:{pol}'
+        prefix = f'asset:{key}:'
+        pol_meta = S1_Pols[pol_upper]
+
+        # Product, calibration and noise schemas
+        for name, title, description, attr_name in _SCHEMA_ASSETS:
+            attr_key = prefix + attr_name
+            assets[f'schema-{name}-{beam}-{pol}'] = XMLAsset(
+                path=base + attr[attr_key],
+                title=f'{pol_upper} {title}',
+                description=description,
+                roles=('metadata', beam),
+                checksum=attr[f'{attr_key}:checksum'],
+                size=attr[f'{attr_key}:size'],
+            )
 
         # Measurement
         assets[f'{beam}-{pol}'] = CloudOptimizedGeoTIFFAsset(
-            path=f'{item_path}/{attr[f"asset:{beam}:{pol}:measurement"]}',
-            title=S1_Pols[pol.upper()]['title'],
-            description=S1_Pols[pol.upper()]['description'],
+            path=base + attr[prefix + 'measurement'],
+            title=pol_meta['title'],
+            description=pol_meta['description'],
             roles=('data', beam),
-            checksum=attr[f'asset:{beam}:{pol}:measurement:checksum'],
-            size=attr[f'asset:{beam}:{pol}:measurement:size'],
+            checksum=attr[prefix + 'measurement:checksum'],
+            size=attr[prefix + 'measurement:size'],
             extra={
                 'data_type': 'cint16',
                 'proj:code': None,
-                'proj:shape': [
-                    attr[f'shape1:{beam}:{pol}'],
-                    attr[f'shape2:{beam}:{pol}'],
-                ],
-                'sar:polarizations': [pol.upper()],
-                'sar:looks_range': attr[f'looksRange:{beam}:{pol}'],
-                'sar:looks_azimuth': attr[f'looksAzimuth:{beam}:{pol}'],
-                'sar:pixel_spacing_range': attr[f'rangePixelSpacing:{beam}:{pol}'],
-                'sar:pixel_spacing_azimuth': attr[f'azimuthPixelSpacing:{beam}:{pol}'],
-                'view:incidence_angle': attr[f'incidenceAngleMid:{beam}:{pol}'],
-                'view:azimuth': normalize_angle(attr[f'azimuthAngle:{beam}:{pol}']),
+                'proj:shape': [attr[f'shape1:{key}'], attr[f'shape2:{key}']],
+                'sar:polarizations': [pol_upper],
+                'sar:looks_range': attr[f'looksRange:{key}'],
+                'sar:looks_azimuth': attr[f'looksAzimuth:{key}'],
+                'sar:pixel_spacing_range': attr[f'rangePixelSpacing:{key}'],
+                'sar:pixel_spacing_azimuth': attr[f'azimuthPixelSpacing:{key}'],
+                'view:incidence_angle': attr[f'incidenceAngleMid:{key}'],
+                'view:azimuth': normalize_angle(attr[f'azimuthAngle:{key}']),
             },
         )
 
-    item = STACItem(
-        path=attr['filepath'],
-        odata=odata,
-        collection='sentinel-1-slc',
-        identifier=attr['identifier'],
-        coordinates=attr['coordinates'],
-        links=[
-            TraceabilityLink(
-                href=f'{attr["filename"]}.zip',
-            )
-        ],
-        assets=assets,
-        extensions=(
-            StacExtension.SATELLITE,
-            StacExtension.PROCESSING,
-            StacExtension.PRODUCT,
-            StacExtension.PROJECTION,
-            StacExtension.SAR,
-            StacExtension.VIEW,
-            StacExtension.EOPF,
-        ),
-        extra=props,
-    )
+    return props, assets
 
-    return await item.generate()
+
+def _mode_beams(mode: str, filename: str) -> tuple[str, ...]:
+    if (beams := _MODE_BEAMS.get(mode)) is not None:
+        return beams
+    if mode == 'sm':
+        return ('s' + filename[5],)
+    raise ValueError(f'Unsupported mode beams {mode!r}')
 
 
 def _get_timeliness(timeliness: str) -> str:
-    match timeliness:
-        case 'Fast-24h':
-            return 'PT24H'
-        case 'NRT-10m':
-            return 'PT10M'
-        case 'NRT-3h':
-            return 'PT3H'
-    raise ValueError(f'Unsupported timeliness {timeliness!r}')
+    try:
+        return _TIMELINESS[timeliness]
+    except KeyError:
+        raise ValueError(f'Unsupported timeliness {timeliness!r}') from None
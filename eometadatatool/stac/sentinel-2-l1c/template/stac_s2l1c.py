@@ -1,10 +1,11 @@
 from math import isnan
 from typing import Any
 
-from eometadatatool.dlc import get_odata_id, s2_compute_average
+from eometadatatool.dlc import overlap_odata, s2_compute_average
 from eometadatatool.stac.framework.stac_asset import (
     JPEG2000Asset,
     ProductManifestAsset,
+    STACAsset,
     ThumbnailAsset,
     XMLAsset,
 )
@@ -16,10 +17,136 @@ from eometadatatool.stac.framework.stac_link import (
     TraceabilityLink,
     ZipperLink,
 )
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
+
+_REQUIRED_KEYS: frozenset[str] = frozenset((
+    'INSPIRE:checksum',
+    'INSPIRE:size',
+    'MTD_DS',
+    'MTD_DS:checksum',
+    'MTD_DS:size',
+    'MTD_MSIL1C:checksum',
+    'MTD_MSIL1C:size',
+    'MTD_TL',
+    'MTD_TL:checksum',
+    'MTD_TL:size',
+    'asset:TCI',
+    'asset:TCI:file:checksum',
+    'asset:TCI:file:size',
+    'beginningDateTime',
+    'cloudCover',
+    'coordinates',
+    'datastripId',
+    'endingDateTime',
+    'epsg',
+    'filepath',
+    'grid:code',
+    'identifier',
+    'illuminationZenithAngle',
+    'instrumentShortName',
+    'manifest.safe:checksum:MD5',
+    'manifest.safe:size',
+    'orbitDirection',
+    'platformSerialIdentifier',
+    'platformShortName',
+    'processingDate',
+    'productGroupId',
+    'productType',
+    'ql:checksum',
+    'ql:path',
+    'ql:size',
+    'raster:bands:nodata',
+    'relativeOrbitNumber',
+    's2msi:dataTakeType',
+    'sat:absolute_orbit',
+    'view:sun_elevation',
+))
+"""Attributes that every product must provide, checked before rendering starts."""
+
+_NSSDC_BY_SERIAL: dict[str, str] = {
+    '2A': '2015-028A',
+    '2B': '2017-013A',
+    '2C': '2024-157A',
+}
+"""Platform serial identifier → NSSDC international designator."""
+
+_S2_BAND_GSD: dict[str, int] = {
+    'B01': 60,
+    'B02': 10,
+    'B03': 10,
+    'B04': 10,
+    'B05': 20,
+    'B06': 20,
+    'B07': 20,
+    'B08': 10,
+    'B8A': 20,
+    'B09': 60,
+    'B10': 60,
+    'B11': 20,
+    'B12': 20,
+}
+"""Band id → ground sampling distance of the MSI band in meters."""
+
+_S2_BANDS = tuple(zip(S2_Bands, generate_bands(S2_Bands, None), strict=True))
+_TCI_BANDS = generate_bands(S2_Bands, ('B04', 'B03', 'B02'))
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
+    if missing := _REQUIRED_KEYS.difference(attr):
+        raise KeyError(f'Missing attributes: {", ".join(sorted(missing))}')
+
+    item_path: str = attr['filepath']
+    odata, (props, assets) = await overlap_odata(
+        item_path, _props_and_assets, attr, item_path
+    )
+
+    links: list[STACLink] = [
+        TraceabilityLink(href=f'{odata.name}.zip'),
+        ZipperLink(href=attr['filepath']),
+    ]
+
+    item = STACItem(
+        path=item_path,
+        odata=odata,
+        collection='sentinel-2-l1c',
+        identifier=attr['identifier'],
+        coordinates=attr['coordinates'],
+        links=links,
+        product_asset_name='Product',
+        assets=assets,
+        extensions=(
+            StacExtension.EO,
+            StacExtension.RASTER,
+            StacExtension.SATELLITE,
+            StacExtension.GRID,
+            StacExtension.VIEW,
+            StacExtension.PRODUCT,
+            StacExtension.PROJECTION,
+        ),
+        extra=props,
+    )
+
+    return await item.generate()
+
+
+def _props_and_assets(
+    attr: dict[str, Any], item_path: str
+) -> tuple[dict[str, Any], dict[str, STACAsset]]:
     proj = f'EPSG:{attr["epsg"]}'
+    extra: dict[str, Any] = {}
+    if processor_version := attr.get('processorVersion'):
+        extra['processing:version'] = processor_version
+    average_azimuth = s2_compute_average(
+        attr[f'asset:{band_id}:view:azimuth'] for band_id in S2_Bands
+    )
+    if not isnan(average_azimuth):
+        extra['view:azimuth'] = average_azimuth
+    average_incidence_angle = s2_compute_average(
+        attr[f'asset:{band_id}:view:incidence_angle'] for band_id in S2_Bands
+    )
+    if not isnan(average_incidence_angle):
+        extra['view:incidence_angle'] = average_incidence_angle
+
     props = {
         'datetime': attr['beginningDateTime'],
         'start_datetime': attr['beginningDateTime'],
@@ -37,30 +164,20 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         'sat:orbit_state': attr['orbitDirection'].lower(),
         'sat:relative_orbit': attr['relativeOrbitNumber'],
         'sat:absolute_orbit': attr['sat:absolute_orbit'],
-        'sat:platform_international_designator': {
-            '2A': '2015-028A',
-            '2B': '2017-013A',
-            '2C': '2024-157A',
-        }.get(attr['platformSerialIdentifier'], attr.get('nssdcIdentifier')),
+        'sat:platform_international_designator': _NSSDC_BY_SERIAL.get(
+            attr['platformSerialIdentifier'], attr.get('nssdcIdentifier')
+        ),
         'grid:code': attr['grid:code'],
         'view:sun_azimuth': attr['illuminationZenithAngle'],
         'view:sun_elevation': 90 - attr['view:sun_elevation'],
         'eopf:datastrip_id': attr['datastripId'],
         'eopf:datatake_id': attr['productGroupId'],
         'eopf:instrument_mode': attr['s2msi:dataTakeType'],
+        **extra,
     }
-    if processor_version := attr.get('processorVersion'):
-        props['processing:version'] = processor_version
-    average_azimuth = s2_compute_average(attr, 'view:azimuth')
-    if not isnan(average_azimuth):
-        props['view:azimuth'] = average_azimuth
-    average_incidence_angle = s2_compute_average(attr, 'view:incidence_angle')
-    if not isnan(average_incidence_angle):
-        props['view:incidence_angle'] = average_incidence_angle
+    sanitize_relative_orbit(props)
 
-    item_path: str = attr['filepath']
-    odata = await get_odata_id(item_path)
-    assets = {
+    assets: dict[str, STACAsset] = {
         'safe_manifest': ProductManifestAsset(
             path=f'{item_path}/manifest.safe',
             title='manifest.safe',
@@ -109,9 +226,14 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         ),
     }
 
-    for band_id, band in zip(S2_Bands, generate_bands(S2_Bands, None), strict=True):
-        res = int(attr[f'asset:{band_id}:eo:gsd'])
+    # Bands share one of three resolutions; build each projection only once
+    projections: dict[int, dict[str, Any]] = {}
+    base = item_path + '/'
+    for band_id, band in _S2_BANDS:
         asset_key = f'asset:{band_id}'
+        res = _S2_BAND_GSD[band_id]
+        if (projection := projections.get(res)) is None:
+            projection = projections[res] = _projection(attr, res)
 
         extra = {
             'bands': (band,),
@@ -121,40 +243,17 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             'raster:offset': -0.1,
             'gsd': res,
             'proj:code': proj,
-            'proj:shape': [
-                attr[f'asset:proj:shape:{res}:NCOLS'],
-                attr[f'asset:proj:shape:{res}:NROWS'],
-            ],
-            'proj:bbox': [
-                attr[f'asset:proj:transform:{res}:ULX'],
-                (
-                    attr[f'asset:proj:transform:{res}:ULY']
-                    - res * attr[f'asset:proj:shape:{res}:NCOLS']
-                ),
-                (
-                    attr[f'asset:proj:transform:{res}:ULX']
-                    + res * attr[f'asset:proj:shape:{res}:NROWS']
-                ),
-                attr[f'asset:proj:transform:{res}:ULY'],
-            ],
-            'proj:transform': (
-                res,
-                0,
-                attr[f'asset:proj:transform:{res}:ULX'],
-                0,
-                -res,
-                attr[f'asset:proj:transform:{res}:ULY'],
-            ),
+            **projection,
         }
-        view_azimuth = attr[f'asset:{band_id}:view:azimuth']
+        view_azimuth = attr[f'{asset_key}:view:azimuth']
         if not isnan(view_azimuth):
             extra['view:azimuth'] = view_azimuth
-        view_incidence_angle = attr[f'asset:{band_id}:view:incidence_angle']
+        view_incidence_angle = attr[f'{asset_key}:view:incidence_angle']
         if not isnan(view_incidence_angle):
             extra['view:incidence_angle'] = view_incidence_angle
 
         assets[band_id] = JPEG2000Asset(
-            path=f'{item_path}/{attr[asset_key]}',
+            path=base + attr[asset_key],
             title=f'{band["description"]} - {res}m',
             roles=('data', 'reflectance'),
             size=attr[f'{asset_key}:file:size'],
@@ -163,6 +262,8 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             extra=extra,
         )
 
+    if (tci_projection := projections.get(10)) is None:
+        tci_projection = _projection(attr, 10)
     assets['TCI'] = JPEG2000Asset(
         path=f'{item_path}/{attr["asset:TCI"]}',
         title='True color image',
@@ -171,62 +272,26 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         checksum=attr['asset:TCI:file:checksum'],
         checksum_fn_code=0x16,
         extra={
-            'bands': generate_bands(S2_Bands, ('B04', 'B03', 'B02')),
+            'bands': _TCI_BANDS,
             'data_type': 'uint8',
             'nodata': 0,
             'gsd': 10,
             'proj:code': proj,
-            'proj:shape': [
-                attr['asset:proj:shape:10:NCOLS'],
-                attr['asset:proj:shape:10:NROWS'],
-            ],
-            'proj:bbox': [
-                attr['asset:proj:transform:10:ULX'],
-                (
-                    attr['asset:proj:transform:10:ULY']
-                    - 10 * attr['asset:proj:shape:10:NCOLS']
-                ),
-                (
-                    attr['asset:proj:transform:10:ULX']
-                    + 10 * attr['asset:proj:shape:10:NROWS']
-                ),
-                attr['asset:proj:transform:10:ULY'],
-            ],
-            'proj:transform': (
-                10,
-                0,
-                attr['asset:proj:transform:10:ULX'],
-                0,
-                -10,
-                attr['asset:proj:transform:10:ULY'],
-            ),
+            **tci_projection,
         },
     )
 
-    links: list[STACLink] = [
-        TraceabilityLink(href=f'{odata.name}.zip'),
-        ZipperLink(href=attr['filepath']),
-    ]
+    return props, assets
 
-    item = STACItem(
-        path=item_path,
-        odata=odata,
-        collection='sentinel-2-l1c',
-        identifier=attr['identifier'],
-        coordinates=attr['coordinates'],
-        links=links,
-        product_asset_name='Product',
-        assets=assets,
-        extensions=(
-            StacExtension.EO,
-            StacExtension.RASTER,
-            StacExtension.SATELLITE,
-            StacExtension.GRID,
-            StacExtension.VIEW,
-            StacExtension.PRODUCT,
-            StacExtension.PROJECTION,
-        ),
-        extra=props,
-    )
 
-    return await item.generate()
+def _projection(attr: dict[str, Any], res: int) -> dict[str, Any]:
+    """Projection properties of the raster grid with the given resolution."""
+    ncols = attr[f'asset:proj:shape:{res}:NCOLS']
+    nrows = attr[f'asset:proj:shape:{res}:NROWS']
+    ulx = attr[f'asset:proj:transform:{res}:ULX']
+    uly = attr[f'asset:proj:transform:{res}:ULY']
+    return {
+        'proj:shape': (ncols, nrows),
+        'proj:bbox': (ulx, uly - res * ncols, ulx + res * nrows, uly),
+        'proj:transform': (res, 0, ulx, 0, -res, uly),
+    }
@@ -1,10 +1,11 @@
 from math import isnan
-from typing import Any
+from typing import Any, NamedTuple
 
-from eometadatatool.dlc import get_odata_id, s2_compute_average
+from eometadatatool.dlc import overlap_odata, s2_compute_average
 from eometadatatool.stac.framework.stac_asset import (
     JPEG2000Asset,
     ProductManifestAsset,
+    STACAsset,
     ThumbnailAsset,
     XMLAsset,
 )
@@ -16,10 +17,153 @@ from eometadatatool.stac.framework.stac_link import (
     TraceabilityLink,
     ZipperLink,
 )
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
+
+_NSSDC_BY_SERIAL: dict[str, str] = {
+    '2A': '2015-028A',
+    '2B': '2017-013A',
+    '2C': '2024-157A',
+}
+"""Platform serial identifier → NSSDC international designator."""
+
+
+class _Grid(NamedTuple):
+    ncols: int
+    nrows: int
+    bbox: tuple[float, float, float, float]
+    transform: tuple[float, ...]
+
+
+class _BandKeys(NamedTuple):
+    gsd: str
+    view_azimuth: str
+    view_incidence_angle: str
+
+
+class _BandAssetKeys(NamedTuple):
+    name: str
+    path: str
+    size: str
+    checksum: str
+
+
+_BAND_KEYS: dict[str, _BandKeys] = {
+    band_id: _BandKeys(
+        gsd=f'asset:{band_id}:eo:gsd',
+        view_azimuth=f'asset:{band_id}:view:azimuth',
+        view_incidence_angle=f'asset:{band_id}:view:incidence_angle',
+    )
+    for band_id in S2_Bands
+}
+"""Per-band attribute names, formatted once at import."""
+
+_BAND_ASSET_KEYS: dict[tuple[str, int], _BandAssetKeys] = {
+    (band_id, res): _BandAssetKeys(
+        name=f'{band_id}_{res}m',
+        path=f'asset:{band_id}:{res}m',
+        size=f'asset:{band_id}:{res}m:file:size',
+        checksum=f'asset:{band_id}:{res}m:file:checksum',
+    )
+    for band_id in S2_Bands
+    for res in (10, 20, 60)
+}
+"""Per-band, per-resolution asset name and attribute names, formatted once at import."""
+
+
+_SCL_CLASSES: tuple[dict[str, Any], ...] = (
+    {'value': 0, 'name': 'no_data', 'nodata': True},
+    {'value': 1, 'name': 'saturated_or_defective'},
+    {'value': 2, 'name': 'dark_area_pixels'},
+    {'value': 3, 'name': 'cloud_shadows'},
+    {'value': 4, 'name': 'vegetation'},
+    {'value': 5, 'name': 'not_vegetated'},
+    {'value': 6, 'name': 'water'},
+    {'value': 7, 'name': 'unclassified'},
+    {'value': 8, 'name': 'cloud_medium_probability'},
+    {'value': 9, 'name': 'cloud_high_probability'},
+    {'value': 10, 'name': 'thin_cirrus'},
+    {'value': 11, 'name': 'snow'},
+)
+"""Scene classification classes, without the per-product percentages."""
+
+_STATISTICS_KEYS: tuple[str, ...] = (
+    'nodata',
+    'saturated_defective',
+    'dark_area',
+    'cloud_shadow',
+    'vegetation',
+    'not_vegetated',
+    'water',
+    'unclassified',
+    'medium_proba_clouds',
+    'high_proba_clouds',
+    'thin_cirrus',
+)
+"""Item statistics keys for every class in _SCL_CLASSES except snow."""
+
+_SAMPLING: dict[tuple[int, int], str] = {
+    (original_res, res): (
+        'sampling:original'
+        if original_res == res
+        else 'sampling:upsampled'
+        if original_res > res
+        else 'sampling:downsampled'
+    )
+    for original_res in (10, 20, 60)
+    for res in (10, 20, 60)
+}
+"""(original resolution, asset resolution) → sampling role."""
+
+_GSD_ROLES: dict[int, str] = {res: f'gsd:{res}m' for res in (10, 20, 60)}
+"""Asset resolution → gsd role."""
+
+_S2_BANDS = tuple(zip(S2_Bands, generate_bands(S2_Bands, None), strict=True))
+_TCI_BANDS = generate_bands(S2_Bands, ('B04', 'B03', 'B02'))
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
+    item_path: str = attr['filepath']
+    odata, (props, assets) = await overlap_odata(
+        item_path, _props_and_assets, attr, item_path
+    )
+
+    links: list[STACLink] = [
+        TraceabilityLink(href=f'{odata.name}.zip'),
+        ZipperLink(href=attr['filepath']),
+    ]
+
+    item = STACItem(
+        path=item_path,
+        odata=odata,
+        collection='sentinel-2-l2a',
+        identifier=attr['identifier'],
+        coordinates=attr['coordinates'],
+        links=links,
+        product_asset_name='Product',
+        assets=assets,
+        extensions=(
+            StacExtension.EO,
+            StacExtension.RASTER,
+            StacExtension.SATELLITE,
+            StacExtension.GRID,
+            StacExtension.VIEW,
+            StacExtension.CLASSIFICATION,
+            StacExtension.PRODUCT,
+            StacExtension.PROJECTION,
+        ),
+        extra=props,
+    )
+
+    return await item.generate()
+
+
+def _props_and_assets(
+    attr: dict[str, Any], item_path: str
+) -> tuple[dict[str, Any], dict[str, STACAsset]]:
     proj = f'EPSG:{attr["epsg"]}'
+    nodata = attr['raster:bands:nodata']
+    percentages = _scl_percentages(attr)
+    *statistics, snow_ice = percentages
     props = {
         'datetime': attr['beginningDateTime'],
         'start_datetime': attr['beginningDateTime'],
@@ -34,50 +178,40 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         'product:timeliness': 'PT24H',
         'product:timeliness_category': 'NRT',
         'eo:cloud_cover': round(attr['cloudCover'], 2),
-        'eo:snow_cover': attr['s2:snow_ice_percentage'],
+        'eo:snow_cover': snow_ice,
         'sat:orbit_state': attr['orbitDirection'].lower(),
         'sat:relative_orbit': attr['relativeOrbitNumber'],
         'sat:absolute_orbit': attr['sat:absolute_orbit'],
-        'sat:platform_international_designator': {
-            '2A': '2015-028A',
-            '2B': '2017-013A',
-            '2C': '2024-157A',
-        }.get(attr['platformSerialIdentifier'], attr.get('nssdcIdentifier')),
+        'sat:platform_international_designator': _NSSDC_BY_SERIAL.get(
+            attr['platformSerialIdentifier'], attr.get('nssdcIdentifier')
+        ),
         'grid:code': attr['grid:code'],
         'view:sun_azimuth': attr['illuminationZenithAngle'],
         'view:sun_elevation': 90 - attr['view:sun_elevation'],
         'eopf:datastrip_id': attr['datastripId'],
         'eopf:datatake_id': attr['productGroupId'],
         'eopf:instrument_mode': attr['s2msi:dataTakeType'],
-        'statistics': {
-            'nodata': attr['s2:nodata_pixel_percentage'],
-            'saturated_defective': attr['s2:saturated_defective_pixel_percentage'],
-            'dark_area': attr.get(
-                's2:dark_features_percentage',
-                attr.get('s2:cast_shadow_percentage'),
-            ),
-            'cloud_shadow': attr['s2:cloud_shadow_percentage'],
-            'vegetation': attr['s2:vegetation_percentage'],
-            'not_vegetated': attr['s2:not_vegetated_percentage'],
-            'water': attr['s2:water_percentage'],
-            'unclassified': attr['s2:unclassified_percentage'],
-            'medium_proba_clouds': attr['s2:medium_proba_clouds_percentage'],
-            'high_proba_clouds': attr['s2:high_proba_clouds_percentage'],
-            'thin_cirrus': attr['s2:thin_cirrus_percentage'],
-        },
+        'statistics': dict(zip(_STATISTICS_KEYS, statistics, strict=True)),
     }
+    sanitize_relative_orbit(props)
     if processor_version := attr.get('processorVersion'):
         props['processing:version'] = processor_version
-    average_azimuth = s2_compute_average(attr, 'view:azimuth')
+
+    # Read the per-band view angles once, for both the item averages and the bands
+    band_angles = {
+        band_id: (attr[keys.view_azimuth], attr[keys.view_incidence_angle])
+        for band_id, keys in _BAND_KEYS.items()
+    }
+    average_azimuth = s2_compute_average(azimuth for azimuth, _ in band_angles.values())
     if not isnan(average_azimuth):
         props['view:azimuth'] = average_azimuth
-    average_incidence_angle = s2_compute_average(attr, 'view:incidence_angle')
+    average_incidence_angle = s2_compute_average(
+        angle for _, angle in band_angles.values()
+    )
     if not isnan(average_incidence_angle):
         props['view:incidence_angle'] = average_incidence_angle
 
-    item_path: str = attr['filepath']
-    odata = await get_odata_id(item_path)
-    assets = {
+    assets: dict[str, STACAsset] = {
         'safe_manifest': ProductManifestAsset(
             path=f'{item_path}/manifest.safe',
             title='manifest.safe',
@@ -128,374 +262,192 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             },
         )
 
-    for band_id, band in zip(S2_Bands, generate_bands(S2_Bands, None), strict=True):
-        original_res = int(attr[f'asset:{band_id}:eo:gsd'])
+    grids = {res: _grid(attr, res) for res in (10, 20, 60)}
+    # Fields shared by every band asset at a given resolution
+    band_extras = {
+        res: {
+            'data_type': 'uint16',
+            'nodata': nodata,
+            'raster:scale': 0.0001,
+            'raster:offset': -0.1,
+            'gsd': res,
+            'proj:code': proj,
+            'proj:shape': [grid.ncols, grid.nrows],
+            'proj:bbox': grid.bbox,
+            'proj:transform': grid.transform,
+        }
+        for res, grid in grids.items()
+    }
+
+    for band_id, band in _S2_BANDS:
+        band_keys = _BAND_KEYS[band_id]
+        original_res = int(attr[band_keys.gsd])
+        view_azimuth, view_incidence_angle = band_angles[band_id]
+        view_extra = {}
+        if not isnan(view_azimuth):
+            view_extra['view:azimuth'] = view_azimuth
+        if not isnan(view_incidence_angle):
+            view_extra['view:incidence_angle'] = view_incidence_angle
         for res in (10, 20, 60):
-            asset_key = f'asset:{band_id}:{res}m'
-            if asset_key not in attr:
+            keys = _BAND_ASSET_KEYS[band_id, res]
+            if keys.path not in attr:
                 continue
+            sampling = _SAMPLING[original_res, res]
+            extra = {'bands': (band,), **band_extras[res], **view_extra}
 
-            if original_res == res:
-                sampling = 'sampling:original'
-            elif original_res > res:
-                sampling = 'sampling:upsampled'
-            else:
-                sampling = 'sampling:downsampled'
-
-            extra = {
-                'bands': (band,),
-                'data_type': 'uint16',
-                'nodata': attr['raster:bands:nodata'],
-                'raster:scale': 0.0001,
-                'raster:offset': -0.1,
-                'gsd': res,
-                'proj:code': proj,
-                'proj:shape': [
-                    attr[f'asset:proj:shape:{res}:NCOLS'],
-                    attr[f'asset:proj:shape:{res}:NROWS'],
-                ],
-                'proj:bbox': [
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    (
-                        attr[f'asset:proj:transform:{res}:ULY']
-                        - res * attr[f'asset:proj:shape:{res}:NCOLS']
-                    ),
-                    (
-                        attr[f'asset:proj:transform:{res}:ULX']
-                        + res * attr[f'asset:proj:shape:{res}:NROWS']
-                    ),
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ],
-                'proj:transform': (
-                    res,
-                    0,
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    0,
-                    -res,
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ),
-            }
-            view_azimuth = attr[f'asset:{band_id}:view:azimuth']
-            if not isnan(view_azimuth):
-                extra['view:azimuth'] = view_azimuth
-            view_incidence_angle = attr[f'asset:{band_id}:view:incidence_angle']
-            if not isnan(view_incidence_angle):
-                extra['view:incidence_angle'] = view_incidence_angle
-
-            assets[f'{band_id}_{res}m'] = JPEG2000Asset(
-                path=f'{item_path}/{attr[asset_key]}',
+            assets[keys.name] = JPEG2000Asset(
+                path=f'{item_path}/{attr[keys.path]}',
                 title=f'{band["description"]} - {res}m',
                 roles=(
                     'data',
                     'reflectance',
                     sampling,
-                    f'gsd:{res}m',
+                    _GSD_ROLES[res],
                 ),
-                size=attr[f'{asset_key}:file:size'],
-                checksum=attr[f'{asset_key}:file:checksum'],
+                size=attr[keys.size],
+                checksum=attr[keys.checksum],
                 checksum_fn_code=0x16,
                 extra=extra,
             )
 
     # TCI assets
-    tci_bands = generate_bands(S2_Bands, ('B04', 'B03', 'B02'))
     original_res = 10
     for res in (10, 20, 60):
         asset_key = f'asset:TCI:{res}m'
+        grid = grids[res]
 
-        if original_res == res:
-            sampling = 'sampling:original'
-        elif original_res > res:
-            sampling = 'sampling:upsampled'
-        else:
-            sampling = 'sampling:downsampled'
+        sampling = _SAMPLING[original_res, res]
 
         assets[f'TCI_{res}m'] = JPEG2000Asset(
             path=f'{item_path}/{attr[asset_key]}',
             title='True color image',
-            roles=('visual', sampling, f'gsd:{res}m'),
+            roles=('visual', sampling, _GSD_ROLES[res]),
             size=attr[f'{asset_key}:file:size'],
             checksum=attr[f'{asset_key}:file:checksum'],
             checksum_fn_code=0x16,
             extra={
-                'bands': tci_bands,
+                'bands': _TCI_BANDS,
                 'data_type': 'uint8',
                 'nodata': 0,
                 'gsd': res,
                 'proj:code': proj,
-                'proj:shape': [
-                    attr[f'asset:proj:shape:{res}:NCOLS'],
-                    attr[f'asset:proj:shape:{res}:NROWS'],
-                ],
-                'proj:bbox': [
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    (
-                        attr[f'asset:proj:transform:{res}:ULY']
-                        - res * attr[f'asset:proj:shape:{res}:NCOLS']
-                    ),
-                    (
-                        attr[f'asset:proj:transform:{res}:ULX']
-                        + res * attr[f'asset:proj:shape:{res}:NROWS']
-                    ),
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ],
-                'proj:transform': (
-                    res,
-                    0,
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    0,
-                    -res,
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ),
+                'proj:shape': [grid.ncols, grid.nrows],
+                'proj:bbox': grid.bbox,
+                'proj:transform': grid.transform,
             },
         )
 
-    # AOT assets
+    # AOT, SCL and WVP assets, built in one pass over the resolutions and kept
+    # grouped by product in the output
+    scl_classes = tuple(
+        {**scl_class, 'percentage': percentage}
+        for scl_class, percentage in zip(_SCL_CLASSES, percentages, strict=True)
+    )
+    aot_assets: dict[str, JPEG2000Asset] = {}
+    scl_assets: dict[str, JPEG2000Asset] = {}
+    wvp_assets: dict[str, JPEG2000Asset] = {}
     for res in (10, 20, 60):
+        grid = grids[res]
+        gsd_role = _GSD_ROLES[res]
+        grid_extra = {
+            'gsd': res,
+            'proj:code': proj,
+            'proj:shape': [grid.nrows, grid.ncols],
+            'proj:bbox': grid.bbox,
+            'proj:transform': grid.transform,
+        }
+
         asset_key = f'asset:AOT:{res}m'
-        assets[f'AOT_{res}m'] = JPEG2000Asset(
+        aot_assets[f'AOT_{res}m'] = JPEG2000Asset(
             path=f'{item_path}/{attr[asset_key]}',
             title=f'Aerosol optical thickness (AOT) - {res}m',
-            roles=('data', f'gsd:{res}m'),
+            roles=('data', gsd_role),
             size=attr[f'{asset_key}:file:size'],
             checksum=attr[f'{asset_key}:file:checksum'],
             checksum_fn_code=0x16,
             extra={
                 'data_type': 'uint16',
-                'nodata': attr['raster:bands:nodata'],
+                'nodata': nodata,
                 'raster:scale': 0.0001,
                 'raster:offset': -0.1,
-                'gsd': res,
-                'proj:code': proj,
-                'proj:shape': [
-                    attr[f'asset:proj:shape:{res}:NROWS'],
-                    attr[f'asset:proj:shape:{res}:NCOLS'],
-                ],
-                'proj:bbox': [
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    (
-                        attr[f'asset:proj:transform:{res}:ULY']
-                        - res * attr[f'asset:proj:shape:{res}:NCOLS']
-                    ),
-                    (
-                        attr[f'asset:proj:transform:{res}:ULX']
-                        + res * attr[f'asset:proj:shape:{res}:NROWS']
-                    ),
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ],
-                'proj:transform': (
-                    res,
-                    0,
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    0,
-                    -res,
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ),
+                **grid_extra,
             },
         )
 
-    # SCL assets
-    original_res = 20
-    for res in (20, 60):
-        asset_key = f'asset:SCL:{res}m'
-
-        if original_res == res:
-            sampling = 'sampling:original'
-        elif original_res > res:
-            sampling = 'sampling:upsampled'
-        else:
-            sampling = 'sampling:downsampled'
-
-        assets[f'SCL_{res}m'] = JPEG2000Asset(
-            path=f'{item_path}/{attr[asset_key]}',
-            title=f'Scene classification map (SCL) - {res}m',
-            roles=('data', sampling, f'gsd:{res}m'),
-            size=attr[f'{asset_key}:file:size'],
-            checksum=attr[f'{asset_key}:file:checksum'],
-            checksum_fn_code=0x16,
-            extra={
-                'data_type': 'uint8',
-                'nodata': attr['raster:bands:nodata'],
-                'gsd': res,
-                'proj:code': proj,
-                'proj:shape': [
-                    attr[f'asset:proj:shape:{res}:NROWS'],
-                    attr[f'asset:proj:shape:{res}:NCOLS'],
-                ],
-                'proj:bbox': [
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    (
-                        attr[f'asset:proj:transform:{res}:ULY']
-                        - res * attr[f'asset:proj:shape:{res}:NCOLS']
-                    ),
-                    (
-                        attr[f'asset:proj:transform:{res}:ULX']
-                        + res * attr[f'asset:proj:shape:{res}:NROWS']
+        # SCL is produced at 20 m and downsampled to 60 m
+        if res != 10:
+            sampling = _SAMPLING[20, res]
+            asset_key = f'asset:SCL:{res}m'
+            scl_assets[f'SCL_{res}m'] = JPEG2000Asset(
+                path=f'{item_path}/{attr[asset_key]}',
+                title=f'Scene classification map (SCL) - {res}m',
+                roles=('data', sampling, gsd_role),
+                size=attr[f'{asset_key}:file:size'],
+                checksum=attr[f'{asset_key}:file:checksum'],
+                checksum_fn_code=0x16,
+                extra={
+                    'data_type': 'uint8',
+                    'nodata': nodata,
+                    **grid_extra,
+                    'classification:classes': (
+                        scl_classes if sampling == 'sampling:original' else _SCL_CLASSES
                     ),
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ],
-                'proj:transform': (
-                    res,
-                    0,
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    0,
-                    -res,
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ),
-                'classification:classes': (
-                    {
-                        'value': 0,
-                        'name': 'no_data',
-                        'nodata': True,
-                        'percentage': attr['s2:nodata_pixel_percentage'],
-                    },
-                    {
-                        'value': 1,
-                        'name': 'saturated_or_defective',
-                        'percentage': attr['s2:saturated_defective_pixel_percentage'],
-                    },
-                    {
-                        'value': 2,
-                        'name': 'dark_area_pixels',
-                        'percentage': attr.get(
-                            's2:dark_features_percentage',
-                            attr.get('s2:cast_shadow_percentage'),
-                        ),
-                    },
-                    {
-                        'value': 3,
-                        'name': 'cloud_shadows',
-                        'percentage': attr['s2:cloud_shadow_percentage'],
-                    },
-                    {
-                        'value': 4,
-                        'name': 'vegetation',
-                        'percentage': attr['s2:vegetation_percentage'],
-                    },
-                    {
-                        'value': 5,
-                        'name': 'not_vegetated',
-                        'percentage': attr['s2:not_vegetated_percentage'],
-                    },
-                    {
-                        'value': 6,
-                        'name': 'water',
-                        'percentage': attr['s2:water_percentage'],
-                    },
-                    {
-                        'value': 7,
-                        'name': 'unclassified',
-                        'percentage': attr['s2:unclassified_percentage'],
-                    },
-                    {
-                        'value': 8,
-                        'name': 'cloud_medium_probability',
-                        'percentage': attr['s2:medium_proba_clouds_percentage'],
-                    },
-                    {
-                        'value': 9,
-                        'name': 'cloud_high_probability',
-                        'percentage': attr['s2:high_proba_clouds_percentage'],
-                    },
-                    {
-                        'value': 10,
-                        'name': 'thin_cirrus',
-                        'percentage': attr['s2:thin_cirrus_percentage'],
-                    },
-                    {
-                        'value': 11,
-                        'name': 'snow',
-                        'percentage': attr['s2:snow_ice_percentage'],
-                    },
-                )
-                if sampling == 'sampling:original'
-                else (
-                    {'value': 0, 'name': 'no_data', 'nodata': True},
-                    {'value': 1, 'name': 'saturated_or_defective'},
-                    {'value': 2, 'name': 'dark_area_pixels'},
-                    {'value': 3, 'name': 'cloud_shadows'},
-                    {'value': 4, 'name': 'vegetation'},
-                    {'value': 5, 'name': 'not_vegetated'},
-                    {'value': 6, 'name': 'water'},
-                    {'value': 7, 'name': 'unclassified'},
-                    {'value': 8, 'name': 'cloud_medium_probability'},
-                    {'value': 9, 'name': 'cloud_high_probability'},
-                    {'value': 10, 'name': 'thin_cirrus'},
-                    {'value': 11, 'name': 'snow'},
-                ),
-            },
-        )
+                },
+            )
 
-    # WVP assets
-    for res in (10, 20, 60):
         asset_key = f'asset:WVP:{res}m'
-        gsd = res
-        assets[f'WVP_{res}m'] = JPEG2000Asset(
+        wvp_assets[f'WVP_{res}m'] = JPEG2000Asset(
             path=f'{item_path}/{attr[asset_key]}',
             title=f'Water vapour (WVP) - {res}m',
-            roles=('data', f'gsd:{res}m'),
+            roles=('data', gsd_role),
             size=attr[f'{asset_key}:file:size'],
             checksum=attr[f'{asset_key}:file:checksum'],
             checksum_fn_code=0x16,
             extra={
                 'data_type': 'uint16',
-                'nodata': attr['raster:bands:nodata'],
+                'nodata': nodata,
                 'raster:scale': 0.0001,
                 'raster:offset': -0.1,
-                'gsd': gsd,
-                'proj:code': proj,
-                'proj:shape': [
-                    attr[f'asset:proj:shape:{res}:NROWS'],
-                    attr[f'asset:proj:shape:{res}:NCOLS'],
-                ],
-                'proj:bbox': [
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    (
-                        attr[f'asset:proj:transform:{res}:ULY']
-                        - gsd * attr[f'asset:proj:shape:{res}:NCOLS']
-                    ),
-                    (
-                        attr[f'asset:proj:transform:{res}:ULX']
-                        + gsd * attr[f'asset:proj:shape:{res}:NROWS']
-                    ),
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ],
-                'proj:transform': (
-                    gsd,
-                    0,
-                    attr[f'asset:proj:transform:{res}:ULX'],
-                    0,
-                    -gsd,
-                    attr[f'asset:proj:transform:{res}:ULY'],
-                ),
+                **grid_extra,
             },
         )
 
-    links: list[STACLink] = [
-        TraceabilityLink(href=f'{odata.name}.zip'),
-        ZipperLink(href=attr['filepath']),
-    ]
+    assets.update(aot_assets)
+    assets.update(scl_assets)
+    assets.update(wvp_assets)
 
-    item = STACItem(
-        path=item_path,
-        odata=odata,
-        collection='sentinel-2-l2a',
-        identifier=attr['identifier'],
-        coordinates=attr['coordinates'],
-        links=links,
-        product_asset_name='Product',
-        assets=assets,
-        extensions=(
-            StacExtension.EO,
-            StacExtension.RASTER,
-            StacExtension.SATELLITE,
-            StacExtension.GRID,
-            StacExtension.VIEW,
-            StacExtension.CLASSIFICATION,
-            StacExtension.PRODUCT,
-            StacExtension.PROJECTION,
-        ),
-        extra=props,
+    return props, assets
+
+
+def _grid(attr: dict[str, Any], res: int) -> _Grid:
+    ncols = attr[f'asset:proj:shape:{res}:NCOLS']
+    nrows = attr[f'asset:proj:shape:{res}:NROWS']
+    ulx = attr[f'asset:proj:transform:{res}:ULX']
+    uly = attr[f'asset:proj:transform:{res}:ULY']
+    return _Grid(
+        ncols=ncols,
+        nrows=nrows,
+        bbox=(ulx, uly - res * ncols, ulx + res * nrows, uly),
+        transform=(res, 0, ulx, 0, -res, uly),
     )
 
-    return await item.generate()
+
+def _scl_percentages(attr: dict[str, Any]) -> tuple[Any, ...]:
+    """Per-product percentage of each class in _SCL_CLASSES, in the same order."""
+    return (
+        attr['s2:nodata_pixel_percentage'],
+        attr['s2:saturated_defective_pixel_percentage'],
+        attr.get(
+            's2:dark_features_percentage',
+            attr.get('s2:cast_shadow_percentage'),
+        ),
+        attr['s2:cloud_shadow_percentage'],
+        attr['s2:vegetation_percentage'],
+        attr['s2:not_vegetated_percentage'],
+        attr['s2:water_percentage'],
+        attr['s2:unclassified_percentage'],
+        attr['s2:medium_proba_clouds_percentage'],
+        attr['s2:high_proba_clouds_percentage'],
+        attr['s2:thin_cirrus_percentage'],
+        attr['s2:snow_ice_percentage'],
+    )
@@ -1,4 +1,3 @@
-from io import StringIO
 from typing import Any
 
 import numpy as np
@@ -29,7 +28,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
 
     coords_arr = np.asarray(json_data.coords, np.float64)
     coords_arr = coords_arr.reshape(-1, 2)  # flatten rings
-    coords_arr = coords_arr[:, [1, 0]]  # change (lon,lat) into (lat,lon)
+    coords_arr = coords_arr[:, ::-1]  # change (lon,lat) into (lat,lon)
 
     props = {
         'datetime': json_data.start_isodate,
@@ -93,9 +92,9 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         },
     )
 
-    with StringIO() as buf:
-        np.savetxt(buf, coords_arr, fmt='%s', delimiter=' ', newline=' ')
-        coordinates = coordinates_to_wkt((buf.getvalue(),))
+    coordinates = coordinates_to_wkt((
+        ' '.join(f'{lat} {lon}' for lat, lon in coords_arr.tolist()),
+    ))
 
     links: list[STACLink] = [
         TraceabilityLink(href=f'{odata.name}.zip'),
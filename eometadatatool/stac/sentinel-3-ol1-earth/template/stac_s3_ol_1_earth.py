@@ -3,9 +3,11 @@ from typing import Any
 from eometadatatool.dlc import get_odata_id
 from eometadatatool.stac.framework.stac_asset import (
     NetCDFAsset,
+    NetCDFAssetKeys,
     ProductManifestAsset,
     STACAsset,
     ThumbnailAsset,
+    netcdf_asset_keys,
 )
 from eometadatatool.stac.framework.stac_bands import (
     OLCI_Bands,
@@ -18,6 +20,42 @@ from eometadatatool.stac.framework.stac_link import (
     TraceabilityLink,
     ZipperLink,
 )
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
+
+_NETCDF_ASSET_KEYS: tuple[NetCDFAssetKeys, ...] = tuple(
+    netcdf_asset_keys(
+        asset_id,
+        f'{" ".join(word.title() for word in asset_id.split("-"))} Annotations',
+        asset_id.replace('-', '_'),
+    )
+    for asset_id in (
+        'geo-coordinates',
+        'instrument-data',
+        'quality-flags',
+        'tie-geo-coordinates',
+        'tie-geometries',
+        'tie-meteo',
+        'time-coordinates',
+    )
+)
+"""Standard NetCDF annotation assets, with their titles and attribute names."""
+
+_BAND_ASSET_KEYS: tuple[tuple[NetCDFAssetKeys, NetCDFAssetKeys], ...] = tuple(
+    (
+        netcdf_asset_keys(
+            f'{band_id}_radianceData',
+            f'TOA radiance for OLCI acquisition band {band_id}',
+        ),
+        netcdf_asset_keys(
+            f'{band_id}_radiance_uncData',
+            f'Log10 scaled Radiometric Uncertainty Estimate for OLCI acquisition band {band_id}',
+        ),
+    )
+    for band_id in OLCI_Bands
+)
+"""Per-band (radiance, uncertainty) asset keys, in OLCI_Bands order."""
+
+_OLCI_BANDS = generate_bands(OLCI_Bands, None)
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
@@ -56,6 +94,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             'dubious_samples': attr['dubiousSamples'],
         },
     }
+    sanitize_relative_orbit(props)
     if processor_version := attr.get('processorVersion'):
         props['processing:version'] = processor_version
 
@@ -71,21 +110,12 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         assets['thumbnail'] = ThumbnailAsset(path=ql_path)
 
     # Add standard NetCDF assets
-    for asset_id in (
-        'geo-coordinates',
-        'instrument-data',
-        'quality-flags',
-        'tie-geo-coordinates',
-        'tie-geometries',
-        'tie-meteo',
-        'time-coordinates',
-    ):
-        asset_key = asset_id.replace('-', '_')
-        assets[asset_id] = NetCDFAsset(
-            path=f'{item_path}/{attr[f"asset:{asset_key}"]}',
-            title=f'{" ".join(word.title() for word in asset_id.split("-"))} Annotations',
-            checksum=attr[f'asset:{asset_key}:checksum'],
-            size=attr[f'asset:{asset_key}:size'],
+    for keys in _NETCDF_ASSET_KEYS:
+        assets[keys.name] = NetCDFAsset(
+            path=f'{item_path}/{attr[keys.path]}',
+            title=keys.title,
+            checksum=attr[keys.checksum],
+            size=attr[keys.size],
         )
 
     if 'asset:removed_pixels' in attr:
@@ -97,20 +127,22 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         )
 
     # Add radiance data and uncertainty assets for each band
-    for band_id, band in zip(OLCI_Bands, generate_bands(OLCI_Bands, None), strict=True):
-        assets[f'{band_id}_radianceData'] = NetCDFAsset(
-            path=f'{item_path}/{attr[f"asset:{band_id}_radianceData"]}',
-            title=f'TOA radiance for OLCI acquisition band {band_id}',
-            checksum=attr[f'asset:{band_id}_radianceData:checksum'],
-            size=attr[f'asset:{band_id}_radianceData:size'],
+    for (radiance, uncertainty), band in zip(
+        _BAND_ASSET_KEYS, _OLCI_BANDS, strict=True
+    ):
+        assets[radiance.name] = NetCDFAsset(
+            path=f'{item_path}/{attr[radiance.path]}',
+            title=radiance.title,
+            checksum=attr[radiance.checksum],
+            size=attr[radiance.size],
             extra={'bands': (band,)},
         )
-        if f'asset:{band_id}_radiance_uncData' in attr:
-            assets[f'{band_id}_radiance_uncData'] = NetCDFAsset(
-                path=f'{item_path}/{attr[f"asset:{band_id}_radiance_uncData"]}',
-                title=f'Log10 scaled Radiometric Uncertainty Estimate for OLCI acquisition band {band_id}',
-                checksum=attr[f'asset:{band_id}_radiance_uncData:checksum'],
-                size=attr[f'asset:{band_id}_radiance_uncData:size'],
+        if uncertainty.path in attr:
+            assets[uncertainty.name] = NetCDFAsset(
+                path=f'{item_path}/{attr[uncertainty.path]}',
+                title=uncertainty.title,
+                checksum=attr[uncertainty.checksum],
+                size=attr[uncertainty.size],
                 extra={'bands': (band,)},
             )
 
@@ -1,11 +1,17 @@
 from typing import Any
 
-from eometadatatool.dlc import get_odata_id
+from eometadatatool.dlc import overlap_odata
+from eometadatatool.stac.framework.common_props import (
+    build_common_s3_props,
+    olci_l2_statistics,
+)
 from eometadatatool.stac.framework.stac_asset import (
     NetCDFAsset,
+    NetCDFAssetKeys,
     ProductManifestAsset,
     STACAsset,
     ThumbnailAsset,
+    netcdf_asset_keys,
 )
 from eometadatatool.stac.framework.stac_bands import (
     OLCI_Bands,
@@ -19,49 +25,94 @@ from eometadatatool.stac.framework.stac_link import (
     ZipperLink,
 )
 
+_REFLECTANCE_BANDS: tuple[str, ...] = tuple(
+    f'Oa{i:02d}' for i in (*range(1, 13), 16, 17, 18, 21)
+)
+"""OLCI bands published as reflectance assets."""
+
+_REFLECTANCE_ASSET_KEYS: tuple[tuple[NetCDFAssetKeys, dict[str, Any]], ...] = tuple(
+    (
+        netcdf_asset_keys(
+            f'{band_id}_reflectanceData',
+            f'Reflectance for OLCI acquisition band {band_id}',
+        ),
+        {'bands': generate_bands(OLCI_Bands, (band_id,))},
+    )
+    for band_id in _REFLECTANCE_BANDS
+)
+"""(keys, extra) per reflectance asset. Extras are shared between items."""
+
+_LINEAGE_EXTRAS: dict[str, dict[str, Any]] = {
+    'trsp': {'processing:lineage': 'Input bands: Oa04, Oa06'},
+    'chl-Nn': {
+        'processing:lineage': 'Input bands: Oa01, Oa02, Oa03, Oa04, Oa05, Oa06, Oa07, Oa08, Oa09, Oa10, Oa11, Oa12, Oa16, Oa17, Oa18, Oa21'
+    },
+    'chl-Oc4me': {'processing:lineage': 'Input bands: Oa03, Oa04, Oa05, Oa06'},
+    'iop-Nn': {'processing:lineage': 'Input bands: Oa01, Oa12, Oa16, Oa17, Oa21'},
+    'iwv': {'processing:lineage': 'Input bands: Oa18, Oa19'},
+    'tsm-Nn': {
+        'processing:lineage': 'Input bands: Oa01, Oa02, Oa03, Oa04, Oa05, Oa06, Oa07, Oa08, Oa09, Oa10, Oa11, Oa12, Oa16, Oa17, Oa18, Oa21'
+    },
+    'w-Aer': {'processing:lineage': 'Input bands: Oa05, Oa06, Oa17'},
+}
+"""Asset name → processing:lineage extra fields, shared between items."""
+
+_COLLECTIONS: dict[tuple[bool, bool], str] = {
+    (True, True): 'sentinel-3-olci-2-wfr-nrt',
+    (True, False): 'sentinel-3-olci-2-wfr-ntc',
+    (False, True): 'sentinel-3-olci-2-wrr-nrt',
+    (False, False): 'sentinel-3-olci-2-wrr-ntc',
+}
+"""(full resolution, near real time) → collection id."""
+
+_EXTENSIONS: tuple[StacExtension, ...] = (
+    StacExtension.EO,
+    StacExtension.PROCESSING,
+    StacExtension.PRODUCT,
+    StacExtension.PROJECTION,
+    StacExtension.SATELLITE,
+)
+
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
+    item_path: str = attr['filepath']
+    odata, (props, assets) = await overlap_odata(
+        item_path, _props_and_assets, attr, item_path
+    )
+
+    links: list[STACLink] = [
+        TraceabilityLink(href=f'{odata.name}.zip'),
+        ZipperLink(href=attr['filepath']),
+    ]
+
     full_res = attr['productType'].endswith('FR___')
-    props: dict[str, Any] = {
-        'datetime': attr['beginningDateTime'],
-        'start_datetime': attr['beginningDateTime'],
-        'end_datetime': attr['endingDateTime'],
-        'platform': (
-            attr['platformShortName'] + attr['platformSerialIdentifier']
-        ).lower(),
-        'constellation': attr['platformShortName'].lower(),
-        'instruments': (attr['instrumentShortName'].lower(),),
-        'gsd': 300 if full_res else 1200,
-        'processing:level': 'L' + attr['processingLevel'],
-        'processing:datetime': attr['processingDate'],
-        'proj:code': None,
-        'sat:absolute_orbit': attr['orbitNumber'],
-        'sat:relative_orbit': attr['relativeOrbitNumber'],
-        'sat:orbit_cycle': attr['cycleNumber'],
-        'sat:orbit_state': attr['orbitDirection'].lower(),
-        'sat:platform_international_designator': attr['nssdcIdentifier'],
-        'eo:cloud_cover': round(attr['cloudCover'], 2),
-        'product:type': attr['productType'],
-        'product:timeliness': 'PT3H' if attr['timeliness'] == 'NR' else 'P1M',
-        'product:timeliness_category': attr['timeliness'],
-        'statistics': {
-            'saline_water': attr['salineWaterCover'],
-            'coastal': attr['coastalCover'],
-            'fresh_inland_water': attr['freshInlandWaterCover'],
-            'tidal_region': attr['tidalRegionCover'],
-            'land': attr['landCover'],
-            'invalid': attr['invalidPixels'],
-            'cosmetic': attr['cosmeticPixels'],
-            'duplicated': attr['duplicatedPixels'],
-            'saturated': attr['saturatedPixels'],
-            'dubious_samples': attr['dubiousSamples'],
-        },
-    }
-    if processor_version := attr.get('processorVersion'):
-        props['processing:version'] = processor_version
+    collection = _COLLECTIONS[full_res, attr['timeliness'] == 'NR']
 
-    item_path: str = attr['filepath']
-    odata = await get_odata_id(item_path)
+    item = STACItem(
+        path=item_path,
+        odata=odata,
+        collection=collection,
+        identifier=attr['identifier'],
+        coordinates=attr['coordinates'],
+        links=links,
+        assets=assets,
+        extensions=_EXTENSIONS,
+        extra=props,
+    )
+    return await item.generate()
+
+
+def _props_and_assets(
+    attr: dict[str, Any], item_path: str
+) -> tuple[dict[str, Any], dict[str, STACAsset]]:
+    props = build_common_s3_props(
+        attr,
+        instruments=(attr['instrumentShortName'].lower(),),
+        gsd=300 if attr['productType'].endswith('FR___') else 1200,
+        timeliness='PT3H' if attr['timeliness'] == 'NR' else 'P1M',
+        statistics=olci_l2_statistics(attr),
+    )
+    base = item_path + '/'
     assets: dict[str, STACAsset] = {
         'xfdumanifest': ProductManifestAsset(path=f'{item_path}/xfdumanifest.xml'),
     }
@@ -70,86 +121,81 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         assets['thumbnail'] = ThumbnailAsset(path=ql_path)
 
     # Add reflectance data assets
-    for i in [*range(1, 13), 16, 17, 18, 21]:
-        band_id = f'Oa{i:02d}'
-        assets[f'{band_id}_reflectanceData'] = NetCDFAsset(
-            path=f'{item_path}/{attr[f"asset:{band_id}_reflectanceData"]}',
-            title=f'Reflectance for OLCI acquisition band {band_id}',
-            checksum=attr[f'asset:{band_id}_reflectanceData:checksum'],
-            size=attr[f'asset:{band_id}_reflectanceData:size'],
-            extra={'bands': generate_bands(OLCI_Bands, (band_id,))},
+    for keys, extra in _REFLECTANCE_ASSET_KEYS:
+        assets[keys.name] = NetCDFAsset(
+            path=base + attr[keys.path],
+            title=keys.title,
+            checksum=attr[keys.checksum],
+            size=attr[keys.size],
+            extra=extra,
         )
 
     # Add derived products
     assets['trsp'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:trspData"]}',
+        path=base + attr['asset:trspData'],
         title='Transparency properties of water',
         checksum=attr['asset:trspData:checksum'],
         size=attr['asset:trspData:size'],
-        extra={'processing:lineage': 'Input bands: Oa04, Oa06'},
+        extra=_LINEAGE_EXTRAS['trsp'],
     )
 
     assets['chl-Nn'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:chlNnData"]}',
+        path=base + attr['asset:chlNnData'],
         title='Neural net chlorophyll concentration',
         checksum=attr['asset:chlNnData:checksum'],
         size=attr['asset:chlNnData:size'],
-        extra={
-            'processing:lineage': 'Input bands: Oa01, Oa02, Oa03, Oa04, Oa05, Oa06, Oa07, Oa08, Oa09, Oa10, Oa11, Oa12, Oa16, Oa17, Oa18, Oa21'
-        },
+        extra=_LINEAGE_EXTRAS['chl-Nn'],
     )
 
     assets['chl-Oc4me'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:chlOc4meData"]}',
+        path=base + attr['asset:chlOc4meData'],
         title='OC4Me algorithm chlorophyll concentration',
         checksum=attr['asset:chlOc4meData:checksum'],
         size=attr['asset:chlOc4meData:size'],
-        extra={'processing:lineage': 'Input bands: Oa03, Oa04, Oa05, Oa06'},
+        extra=_LINEAGE_EXTRAS['chl-Oc4me'],
     )
 
     assets['iop-Nn'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:iopNnData"]}',
+        path=base + attr['asset:iopNnData'],
         title='Inherent optical properties of water',
         checksum=attr['asset:iopNnData:checksum'],
         size=attr['asset:iopNnData:size'],
-        extra={'processing:lineage': 'Input bands: Oa01, Oa12, Oa16, Oa17, Oa21'},
+        extra=_LINEAGE_EXTRAS['iop-Nn'],
     )
 
     assets['iwv'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:iwv"]}',
+        path=base + attr['asset:iwv'],
         title='Integrated water vapour column',
         checksum=attr['asset:iwv:checksum'],
         size=attr['asset:iwv:size'],
-        extra={'processing:lineage': 'Input bands: Oa18, Oa19'},
+        extra=_LINEAGE_EXTRAS['iwv'],
     )
 
     assets['par'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:parData"]}',
+        path=base + attr['asset:parData'],
         title='Photosynthetically active radiation',
         checksum=attr['asset:parData:checksum'],
         size=attr['asset:parData:size'],
     )
 
     assets['tsm-Nn'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:tsmNnData"]}',
+        path=base + attr['asset:tsmNnData'],
         title='Total suspended matter concentration',
         checksum=attr['asset:tsmNnData:checksum'],
         size=attr['asset:tsmNnData:size'],
-        extra={
-            'processing:lineage': 'Input bands: Oa01, Oa02, Oa03, Oa04, Oa05, Oa06, Oa07, Oa08, Oa09, Oa10, Oa11, Oa12, Oa16, Oa17, Oa18, Oa21'
-        },
+        extra=_LINEAGE_EXTRAS['tsm-Nn'],
     )
 
     assets['w-Aer'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:wAerData"]}',
+        path=base + attr['asset:wAerData'],
         title='Aerosol over water',
         checksum=attr['asset:wAerData:checksum'],
         size=attr['asset:wAerData:size'],
-        extra={'processing:lineage': 'Input bands: Oa05, Oa06, Oa17'},
+        extra=_LINEAGE_EXTRAS['w-Aer'],
     )
 
     assets['wqsf'] = NetCDFAsset(
-        path=f'{item_path}/{attr["asset:wqsfData"]}',
+        path=base + attr['asset:wqsfData'],
         title='Water quality and science flags',
         checksum=attr['asset:wqsfData:checksum'],
         size=attr['asset:wqsfData:size'],
@@ -168,36 +214,10 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         asset_key = asset_id.replace('-', '_')
         if attr.get(f'asset:{asset_key}') is not None:
             assets[asset_id] = NetCDFAsset(
-                path=f'{item_path}/{attr[f"asset:{asset_key}"]}',
+                path=base + attr[f'asset:{asset_key}'],
                 title=attr.get(f'asset:{asset_key}:title', asset_title),
                 checksum=attr[f'asset:{asset_key}:checksum'],
                 size=attr[f'asset:{asset_key}:size'],
             )
 
-    links: list[STACLink] = [
-        TraceabilityLink(href=f'{odata.name}.zip'),
-        ZipperLink(href=attr['filepath']),
-    ]
-
-    collection = 'sentinel-3-olci-2-w'
-    collection += 'fr-' if full_res else 'rr-'
-    collection += 'nrt' if attr['timeliness'] == 'NR' else 'ntc'
-
-    item = STACItem(
-        path=item_path,
-        odata=odata,
-        collection=collection,
-        identifier=attr['identifier'],
-        coordinates=attr['coordinates'],
-        links=links,
-        assets=assets,
-        extensions=(
-            StacExtension.EO,
-            StacExtension.PROCESSING,
-            StacExtension.PRODUCT,
-            StacExtension.PROJECTION,
-            StacExtension.SATELLITE,
-        ),
-        extra=props,
-    )
-    return await item.generate()
+    return props, assets
@@ -1,6 +1,7 @@
 from typing import Any
 
-from eometadatatool.dlc import get_odata_id
+from eometadatatool.dlc import overlap_odata
+from eometadatatool.stac.framework.common_props import build_common_s3_props
 from eometadatatool.stac.framework.stac_asset import (
     NetCDFAsset,
     ProductManifestAsset,
@@ -14,40 +15,54 @@ from eometadatatool.stac.framework.stac_link import (
     ZipperLink,
 )
 
+_EXTENSIONS: tuple[StacExtension, ...] = (
+    StacExtension.EO,
+    StacExtension.PROCESSING,
+    StacExtension.PRODUCT,
+    StacExtension.PROJECTION,
+    StacExtension.SATELLITE,
+)
+
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
-    props: dict[str, Any] = {
-        'datetime': attr['beginningDateTime'],
-        'start_datetime': attr['beginningDateTime'],
-        'end_datetime': attr['endingDateTime'],
-        'platform': (
-            attr['platformShortName'] + attr['platformSerialIdentifier']
-        ).lower(),
-        'constellation': attr['platformShortName'].lower(),
-        'instruments': ('slstr',),
-        'gsd': 9500,
-        'processing:level': 'L' + attr['processingLevel'],
-        'processing:datetime': attr['processingDate'],
-        'proj:code': None,
-        'sat:absolute_orbit': attr['orbitNumber'],
-        'sat:relative_orbit': attr['relativeOrbitNumber'],
-        'sat:orbit_cycle': attr['cycleNumber'],
-        'sat:orbit_state': attr['orbitDirection'].lower(),
-        'sat:platform_international_designator': attr['nssdcIdentifier'],
-        'eo:cloud_cover': round(attr['cloudCover'], 2),
-        'product:type': attr['productType'],
-        'product:timeliness': 'PT3H',
-        'product:timeliness_category': attr['timeliness'],
-        'statistics': {
+    item_path: str = attr['filepath']
+    odata, (props, assets) = await overlap_odata(
+        item_path, _props_and_assets, attr, item_path
+    )
+
+    links: list[STACLink] = [
+        TraceabilityLink(href=f'{odata.name}.zip'),
+        ZipperLink(href=attr['filepath']),
+    ]
+
+    item = STACItem(
+        path=item_path,
+        odata=odata,
+        collection='sentinel-3-sl-2-aod-nrt',
+        identifier=attr['identifier'],
+        coordinates=attr['coordinates'],
+        links=links,
+        assets=assets,
+        extensions=_EXTENSIONS,
+        extra=props,
+    )
+
+    return await item.generate()
+
+
+def _props_and_assets(
+    attr: dict[str, Any], item_path: str
+) -> tuple[dict[str, Any], dict[str, STACAsset]]:
+    props = build_common_s3_props(
+        attr,
+        instruments=('slstr',),
+        gsd=9500,
+        timeliness='PT3H',
+        statistics={
             'saline_water': attr['salineWaterCover'],
             'land': attr['landCover'],
         },
-    }
-    if processor_version := attr.get('processorVersion'):
-        props['processing:version'] = processor_version
-
-    item_path: str = attr['filepath']
-    odata = await get_odata_id(item_path)
+    )
     assets: dict[str, STACAsset] = {
         'xfdumanifest': ProductManifestAsset(path=f'{item_path}/xfdumanifest.xml'),
         'manifest': ProductManifestAsset(
@@ -66,28 +81,4 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             extra={'processing:lineage': 'Input bands: S2, S3, S5, S6'},
         ),
     }
-
-    links: list[STACLink] = [
-        TraceabilityLink(href=f'{odata.name}.zip'),
-        ZipperLink(href=attr['filepath']),
-    ]
-
-    item = STACItem(
-        path=item_path,
-        odata=odata,
-        collection='sentinel-3-sl-2-aod-nrt',
-        identifier=attr['identifier'],
-        coordinates=attr['coordinates'],
-        links=links,
-        assets=assets,
-        extensions=(
-            StacExtension.EO,
-            StacExtension.PROCESSING,
-            StacExtension.PRODUCT,
-            StacExtension.PROJECTION,
-            StacExtension.SATELLITE,
-        ),
-        extra=props,
-    )
-
-    return await item.generate()
+    return props, assets
@@ -14,6 +14,7 @@ from eometadatatool.stac.framework.stac_link import (
     TraceabilityLink,
     ZipperLink,
 )
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
@@ -49,6 +50,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             'land': attr['landCover'],
         },
     }
+    sanitize_relative_orbit(props)
     if processor_version := attr.get('processorVersion'):
         props['processing:version'] = processor_version
 
@@ -14,6 +14,7 @@ from eometadatatool.stac.framework.stac_link import (
     TraceabilityLink,
     ZipperLink,
 )
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
@@ -48,6 +49,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         },
         'altm:instrument_mode': 'lrm' if attr['lrmMode'] > 0 else 'sar',
     }
+    sanitize_relative_orbit(props)
     if processor_version := attr.get('processorVersion'):
         props['processing:version'] = processor_version
 
@@ -21,6 +21,7 @@ from eometadatatool.stac.framework.stac_link import (
     TraceabilityLink,
     ZipperLink,
 )
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
 
 
 class _NetCDFExtra(TypedDict, total=False):
@@ -57,6 +58,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         },
         'altm:instrument_mode': 'lrm' if attr['lrmMode'] > 0 else 'sar',
     }
+    sanitize_relative_orbit(props)
 
     if processor_version := attr.get('processorVersion'):
         props['processing:version'] = processor_version
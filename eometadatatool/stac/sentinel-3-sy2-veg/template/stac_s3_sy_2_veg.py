@@ -18,6 +18,7 @@ from eometadatatool.stac.framework.stac_link import (
     TraceabilityLink,
     ZipperLink,
 )
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
@@ -48,6 +49,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
             'land': attr['landCover'],
         },
     }
+    sanitize_relative_orbit(props)
 
     ## VGP specific attributes
     if attr['productType'] == 'SY_2_VGP___':
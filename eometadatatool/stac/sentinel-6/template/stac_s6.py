@@ -15,6 +15,7 @@ from eometadatatool.stac.framework.stac_bands import (
 from eometadatatool.stac.framework.stac_extension import StacExtension
 from eometadatatool.stac.framework.stac_item import STACItem
 from eometadatatool.stac.framework.stac_link import STACLink, TraceabilityLink
+from eometadatatool.stac.framework.utils import sanitize_relative_orbit
 
 
 async def render(attr: dict[str, Any]) -> dict[str, Any]:
@@ -49,6 +50,7 @@ async def render(attr: dict[str, Any]) -> dict[str, Any]:
         'product:timeliness': timeliness_mapping.get(timeliness),
         'product:timeliness_category': timeliness,
     }
+    sanitize_relative_orbit(props)
     if processor_version := attr.get('processorVersion'):
         props['processing:version'] = processor_version
 
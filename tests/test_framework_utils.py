@@ -0,0 +1,25 @@
+import datetime as dt
+
+import pytest
+
+from eometadatatool.stac.framework.utils import ensure_iso_datetime
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('2020-03-03T01:35:47.000000Z', '2020-03-03T01:35:47.000000Z'),
+        # same length as the normalized form, but must go through the parser
+        ('2020-03-03 01:35:47.000000Z', '2020-03-03T01:35:47.000000Z'),
+        ('2020-03-03T01:35:47.123Z', '2020-03-03T01:35:47.123000Z'),
+        ('2020-03-03T01:35:47Z', '2020-03-03T01:35:47.000000Z'),
+        ('2020-03-03', '2020-03-03T00:00:00.000000Z'),
+        (
+            dt.datetime(2020, 3, 3, 1, 35, 47, tzinfo=dt.UTC),
+            '2020-03-03T01:35:47.000000Z',
+        ),
+        (None, None),
+    ],
+)
+def test_ensure_iso_datetime(value, expected):
+    assert ensure_iso_datetime(value) == expected
@@ -0,0 +1,48 @@
+import pytest
+from shapely.geometry import shape
+
+from eometadatatool.stac.odata.template.stac_odata import _wkt_from_geojson
+
+
+@pytest.mark.parametrize(
+    'geometry',
+    [
+        {'type': 'Point', 'coordinates': [12.5, -45.25]},
+        {'type': 'Point', 'coordinates': [-0.0, 0.0]},
+        {'type': 'Point', 'coordinates': [0.00001234, -0.000099]},
+        {'type': 'Point', 'coordinates': [12.345678901234567, -0.12345678901234568]},
+        {
+            'type': 'Polygon',
+            'coordinates': [
+                [[-0.0, -0.0], [10.0, 0.0], [10.0, 10.5], [0.0, 10.5], [-0.0, -0.0]]
+            ],
+        },
+        {
+            'type': 'Polygon',
+            'coordinates': [
+                [[0, 0], [100, 0], [100, 50], [0, 50], [0, 0]],
+                [[10, 10], [20, 10], [20, 20], [10, 20], [10, 10]],
+            ],
+        },
+        {
+            'type': 'Polygon',
+            'coordinates': [
+                [
+                    [1.2345678901234567, 48.123456789012345],
+                    [2.0000000000000004, 48.123456789012345],
+                    [2.0000000000000004, 49.00001],
+                    [1.2345678901234567, 48.123456789012345],
+                ]
+            ],
+        },
+        {
+            'type': 'MultiPolygon',
+            'coordinates': [
+                [[[179.5, -0.0], [180.0, -0.0], [180.0, 1.0], [179.5, -0.0]]],
+                [[[-180.0, 0.0], [-179.5, 0.0], [-180.0, 1.0], [-180.0, 0.0]]],
+            ],
+        },
+    ],
+)
+def test_wkt_from_geojson_matches_shapely(geometry):
+    assert _wkt_from_geojson(geometry) == shape(geometry).wkt
@@ -0,0 +1,28 @@
+import importlib
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+import pytest
+
+from eometadatatool.extract import extract
+from eometadatatool.stac.framework.stac_bands import S2_Bands
+
+_TESTS_DIR = Path(__file__).parent
+_DATA_DIR = _TESTS_DIR.joinpath('data')
+
+_S2L1C = importlib.import_module(
+    'eometadatatool.stac.sentinel-2-l1c.template.stac_s2l1c'
+)
+
+
+@pytest.mark.asyncio
+async def test_band_gsd_matches_mapping():
+    # the template uses a fixed table, so catch drift from the mapped eo:gsd values
+    scene = _DATA_DIR.joinpath(
+        'S2A_MSIL1C_20230216T044851_N0509_R076_T46UEU_20230216T000000.SAFE.zip'
+    )
+    async with AsyncExitStack() as stack:
+        _, attr = await extract(scene, stack=stack)
+
+    mapped = {band_id: attr[f'asset:{band_id}:eo:gsd']['Value'] for band_id in S2_Bands}
+    assert mapped == _S2L1C._S2_BAND_GSD